@@ -36,6 +36,16 @@ class Settings(BaseSettings):
     auto_renew_subscriptions: bool = True  # Enable/disable auto-renewal of subscriptions
     subscription_renewal_minutes: int = 57  # Teams max is 60 minutes
     
+    # Optional: File to persist the MSAL token cache across restarts
+    graph_token_cache_path: Optional[str] = None
+    
+    # Graph connection pool: burst capacity above the idle keep-alive pool
+    graph_connection_limit: int = 20
+    graph_keepalive_limit: int = 10
+    graph_keepalive_seconds: float = 75.0
+    # Cap on in-flight Graph requests, so notification bursts don't trigger throttling
+    graph_max_concurrency: int = 16
+    
     @validator("allowed_users")
     def parse_allowed_users(cls, v):
         """Parse comma-separated email list."""
@@ -1,14 +1,16 @@
 """FastAPI application entry point for Teams-Notion middleware."""
+import asyncio
 import logging
 import os
-from urllib.parse import unquote_plus
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse
 from fastapi.middleware import Middleware
 from fastapi.middleware.gzip import GZipMiddleware
 from routes import webhooks, subscription, diagnostics
-from services.graph_service import GraphService
-from services.notion_service import NotionService
+from services.graph_service import graph_service
+from services.notion_service import notion_service
 from config import settings
 
 # Configure logging
@@ -18,9 +20,62 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Create service singletons at module level for reuse across all requests
-graph_service = GraphService()
-notion_service = NotionService()
+# Upper bound on threads used for blocking calls offloaded with asyncio.to_thread
+BLOCKING_IO_THREADS = 16
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan - start background work, then close the shared clients on shutdown.
+    
+    The Graph and Notion services are process-wide singletons (one connection pool each),
+    exposed on app.state and closed explicitly here rather than relying on __del__.
+    """
+    logger.info("Starting Teams-Notion Webhook Middleware")
+    logger.info(f"Notion Database ID: {settings.notion_database_id}")
+    logger.info(f"Allowed users: {len(settings.allowed_users)} user(s)")
+    logger.info(f"Webhook notification URL: {settings.webhook_notification_url}")
+    
+    # Bounded default executor for sync work (e.g. MSAL token requests) dispatched off the loop
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=BLOCKING_IO_THREADS, thread_name_prefix="blocking-io")
+    )
+    
+    app.state.graph_service = graph_service
+    app.state.notion_service = notion_service
+    
+    # Pre-warm GraphService by acquiring access token
+    logger.info("Pre-warming GraphService - acquiring access token...")
+    try:
+        await graph_service._get_access_token()
+        logger.info("GraphService warmup complete - access token acquired")
+    except Exception as e:
+        logger.error(f"GraphService warmup failed: {str(e)}")
+    
+    # Pre-load the Notion user index so ticket creation never waits on /users pagination
+    await notion_service.warmup()
+    user_index_task = asyncio.create_task(notion_service.refresh_user_index_periodically())
+    
+    # Start background task for polling messages for reactions
+    # (Microsoft Graph doesn't send "updated" notifications when reactions are added)
+    logger.info("Starting background reaction polling task...")
+    polling_task = asyncio.create_task(webhooks.poll_messages_for_reactions())
+    logger.info("Reaction polling task started (checking every 30 seconds)")
+    
+    # Start the worker pool that processes queued webhook notifications
+    webhooks.start_reaction_workers()
+    
+    try:
+        yield
+    finally:
+        logger.info("Shutting down Teams-Notion Webhook Middleware")
+        polling_task.cancel()
+        user_index_task.cancel()
+        await webhooks.stop_reaction_workers()
+        await graph_service.aclose()
+        await notion_service.aclose()
+
 
 # Create FastAPI app with optimizations
 app = FastAPI(
@@ -33,6 +88,7 @@ app = FastAPI(
     openapi_url="/openapi.json",
     # Disable unnecessary features for performance
     default_response_class=JSONResponse,
+    lifespan=lifespan,
 )
 
 # CRITICAL: Ultra-fast validation endpoint for Microsoft Graph
@@ -52,12 +108,12 @@ async def graph_validation(request: Request):
         Processed response from webhook handler for actual notifications
     """
     # CRITICAL: Check for validation token FIRST - fastest path possible
-    # FastAPI's query_params.get() automatically decodes, but unquote_plus ensures it
-    token = request.query_params.get("validationToken")
+    # ValidationFastPathMiddleware normally answers these before routing; this is the fallback
+    token = webhooks.extract_validation_token(request)
     if token:
         # Return decoded token immediately - NO logging, NO processing, NO delays
         # This is the critical path that must be <1ms
-        return PlainTextResponse(unquote_plus(token), media_type="text/plain")
+        return webhooks.validation_response(token)
     
     # If no validation token, this is an actual notification
     # Forward to webhook notification handler for processing
@@ -71,6 +127,10 @@ async def graph_validation(request: Request):
 # Add GZip compression middleware for faster responses
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
+# Added last so it is the outermost layer: validation handshakes on /graph/validate and
+# /webhook are answered before GZip, routing, or any handler runs
+app.add_middleware(webhooks.ValidationFastPathMiddleware)
+
 # Include routers
 app.include_router(webhooks.router)
 app.include_router(subscription.router)
@@ -93,41 +153,6 @@ async def health_check():
     return {"status": "healthy"}
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Startup event handler - initialize services."""
-    logger.info("Starting Teams-Notion Webhook Middleware")
-    logger.info(f"Notion Database ID: {settings.notion_database_id}")
-    logger.info(f"Allowed users: {len(settings.allowed_users)} user(s)")
-    logger.info(f"Webhook notification URL: {settings.webhook_notification_url}")
-    
-    # Pre-warm GraphService by acquiring access token
-    logger.info("Pre-warming GraphService - acquiring access token...")
-    try:
-        graph_service._get_access_token()
-        logger.info("GraphService warmup complete - access token acquired")
-    except Exception as e:
-        logger.error(f"GraphService warmup failed: {str(e)}")
-    
-    # Initialize NotionService
-    logger.info("Initializing NotionService...")
-    logger.info("NotionService initialized")
-    
-    # Start background task for polling messages for reactions
-    # (Microsoft Graph doesn't send "updated" notifications when reactions are added)
-    logger.info("Starting background reaction polling task...")
-    from routes.webhooks import poll_messages_for_reactions
-    import asyncio
-    asyncio.create_task(poll_messages_for_reactions())
-    logger.info("Reaction polling task started (checking every 30 seconds)")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Shutdown event handler."""
-    logger.info("Shutting down Teams-Notion Webhook Middleware")
-
-
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
@@ -140,4 +165,13 @@ async def global_exception_handler(request, exc):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", "8000")))
+    # uvloop + httptools are part of the validation latency budget (both ship with uvicorn[standard]).
+    # Single process only: duplicate detection, polling and the MSAL token cache live in-process.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        backlog=2048,
+    )
@@ -1,6 +1,7 @@
 """Pydantic models for Microsoft Graph webhook payloads."""
 from datetime import datetime
 from typing import List, Optional, Dict, Any
+import orjson
 from pydantic import BaseModel, Field
 
 
@@ -27,6 +28,10 @@ class Notification(BaseModel):
     """Webhook notification payload from Microsoft Graph."""
     value: List[ChangeNotification]
     validationTokens: Optional[List[str]] = None
+    
+    class Config:
+        # Used by parse_raw so webhook bodies are decoded by orjson
+        json_loads = orjson.loads
 
 
 class MessageReaction(BaseModel):
@@ -73,3 +78,7 @@ class GraphMessage(BaseModel):
     channelIdentity: Optional[ChannelIdentity] = None
     attachments: Optional[List[MessageAttachment]] = None
     reactions: Optional[List[MessageReaction]] = None
+    
+    class Config:
+        # Used by parse_raw so Graph message bodies are decoded by orjson
+        json_loads = orjson.loads
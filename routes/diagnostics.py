@@ -1,21 +1,18 @@
 """Diagnostics and testing endpoints for local development."""
+import asyncio
 import logging
 from typing import Dict, Any
 from datetime import datetime, timezone, timedelta
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from services.graph_service import GraphService
-from services.notion_service import NotionService
+from services.graph_service import graph_service
+from services.notion_service import notion_service
 from config import settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
 
-# Initialize services
-graph_service = GraphService()
-notion_service = NotionService()
-
 
 class TestWebhookRequest(BaseModel):
     """Request model for testing webhook validation."""
@@ -68,7 +65,7 @@ async def health_check() -> Dict[str, Any]:
     
     # Check Graph API connection
     try:
-        graph_service._get_access_token()
+        await graph_service._get_access_token()
         health["components"]["graph_api"] = {
             "status": "connected",
             "token_valid": True
@@ -83,7 +80,7 @@ async def health_check() -> Dict[str, Any]:
     # Check Notion API connection
     try:
         # Try to query the database
-        notion_service._make_request("GET", f"/databases/{notion_service.database_id}")
+        await notion_service._make_request("GET", f"/databases/{notion_service.database_id}")
         health["components"]["notion_api"] = {
             "status": "connected",
             "database_accessible": True
@@ -175,7 +172,7 @@ async def list_all_subscriptions() -> Dict[str, Any]:
         List of subscriptions with status
     """
     try:
-        subscriptions = graph_service.list_subscriptions()
+        subscriptions = await graph_service.list_subscriptions()
         
         # Add detailed status info
         now = datetime.now(timezone.utc)
@@ -229,7 +226,8 @@ async def cleanup_expired_subscriptions() -> Dict[str, Any]:
         Summary of cleanup operation
     """
     try:
-        subscriptions = graph_service.list_subscriptions()
+        subscriptions = await graph_service.list_subscriptions()
+        expired = []
         deleted = []
         failed = []
         
@@ -249,17 +247,30 @@ async def cleanup_expired_subscriptions() -> Dict[str, Any]:
                     exp_dt = expiration
                 
                 if (exp_dt - now).total_seconds() <= 0:
-                    graph_service.delete_subscription(sub_id)
-                    deleted.append({
-                        "id": sub_id,
-                        "resource": sub.get("resource")
-                    })
+                    expired.append(sub)
             except Exception as e:
                 failed.append({
                     "id": sub_id,
                     "error": str(e)
                 })
         
+        # Delete all expired subscriptions concurrently
+        results = await asyncio.gather(
+            *(graph_service.delete_subscription(sub["id"]) for sub in expired),
+            return_exceptions=True
+        )
+        for sub, result in zip(expired, results):
+            if isinstance(result, Exception):
+                failed.append({
+                    "id": sub["id"],
+                    "error": str(result)
+                })
+            else:
+                deleted.append({
+                    "id": sub["id"],
+                    "resource": sub.get("resource")
+                })
+        
         return {
             "total_checked": len(subscriptions),
             "deleted": len(deleted),
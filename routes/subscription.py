@@ -5,15 +5,12 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
-from services.graph_service import GraphService
+from services.graph_service import GraphValidationTimeout, graph_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/subscription", tags=["subscriptions"])
 
-# Initialize service
-graph_service = GraphService()
-
 
 class CreateSubscriptionRequest(BaseModel):
     """Request model for creating a subscription."""
@@ -36,7 +33,7 @@ async def list_subscriptions() -> Dict[str, Any]:
         List of subscriptions
     """
     try:
-        subscriptions = graph_service.list_subscriptions()
+        subscriptions = await graph_service.list_subscriptions()
         return {
             "count": len(subscriptions),
             "subscriptions": subscriptions
@@ -91,7 +88,7 @@ async def create_subscription(
                 warmup_start = time.time()
                 logger.info("Auto-warming GraphService before subscription creation...")
                 try:
-                    graph_service._get_access_token()
+                    await graph_service._get_access_token()
                     warmup_time = (time.time() - warmup_start) * 1000
                     logger.info(f"Service warmup complete - token acquired in {warmup_time:.2f}ms")
                 except Exception as e:
@@ -155,7 +152,7 @@ async def create_subscription(
         # Create subscription
         subscription_start = time.time()
         try:
-            subscription = graph_service.create_subscription(
+            subscription = await graph_service.create_subscription(
                 resource=request.resource,
                 change_types=request.change_types,  # Guard function will filter if needed
                 notification_url=validation_url,  # Use dedicated validation endpoint
@@ -170,12 +167,7 @@ async def create_subscription(
             error_message = str(e)
             
             # Check if this is a validation timeout error
-            is_validation_timeout = (
-                "Subscription validation request timed out" in error_message or
-                ("ValidationError" in error_message and "timeout" in error_message.lower())
-            )
-            
-            if is_validation_timeout:
+            if isinstance(e, GraphValidationTimeout):
                 logger.error(
                     f"Subscription validation timeout after {subscription_time:.2f}ms. "
                     f"This usually indicates network latency or routing issues. "
@@ -259,7 +251,7 @@ async def renew_subscription(
     try:
         expiration_datetime = datetime.now(timezone.utc) + timedelta(days=request.expiration_days)
         
-        subscription = graph_service.renew_subscription(
+        subscription = await graph_service.renew_subscription(
             subscription_id=subscription_id,
             expiration_datetime=expiration_datetime
         )
@@ -283,7 +275,7 @@ async def delete_subscription(subscription_id: str) -> Dict[str, str]:
         Success message
     """
     try:
-        graph_service.delete_subscription(subscription_id)
+        await graph_service.delete_subscription(subscription_id)
         logger.info(f"Deleted subscription {subscription_id}")
         return {"status": "success", "message": f"Subscription {subscription_id} deleted"}
     except Exception as e:
@@ -303,21 +295,22 @@ async def renew_all_subscriptions(request: RenewSubscriptionRequest) -> Dict[str
         Summary of renewal operations
     """
     try:
-        subscriptions = graph_service.list_subscriptions()
+        subscriptions = await graph_service.list_subscriptions()
         renewed = []
         failed = []
         
         expiration_datetime = datetime.now(timezone.utc) + timedelta(days=request.expiration_days)
         
-        for sub in subscriptions:
-            sub_id = sub.get("id")
-            if sub_id:
-                try:
-                    graph_service.renew_subscription(sub_id, expiration_datetime)
-                    renewed.append(sub_id)
-                except Exception as e:
-                    logger.error(f"Failed to renew subscription {sub_id}: {str(e)}")
-                    failed.append({"id": sub_id, "error": str(e)})
+        # Renew all subscriptions through Graph $batch (20 renewals per round-trip)
+        sub_ids = [sub.get("id") for sub in subscriptions if sub.get("id")]
+        results = await graph_service.renew_subscriptions(sub_ids, expiration_datetime)
+        
+        for sub_id, result in results.items():
+            if isinstance(result, Exception):
+                logger.error(f"Failed to renew subscription {sub_id}: {str(result)}")
+                failed.append({"id": sub_id, "error": str(result)})
+            else:
+                renewed.append(sub_id)
         
         return {
             "total": len(subscriptions),
@@ -1,36 +1,49 @@
 """Webhook routes for Microsoft Graph notifications."""
 import asyncio
+import functools
+import html
 import logging
+import sys
 import time
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Set, Tuple
 from fastapi import APIRouter, Request, Response, HTTPException
 from fastapi.responses import PlainTextResponse
-from models.webhook_models import Notification, ChangeNotification
-from services.graph_service import GraphService
-from services.notion_service import NotionService
-from utils.validation import is_user_allowed, normalize_email
+from models.webhook_models import Notification, ChangeNotification, GraphMessage, MessageReaction
+from services.graph_service import graph_service
+from services.notion_service import notion_service
+from utils.validation import check_user, normalize_email
 from utils.auth import verify_webhook_client_state
+from utils.subscription_tracking import has_tracked_subscriptions, pop_subscription_creation
 from datetime import datetime, timezone
-from urllib.parse import unquote, unquote_plus
+from urllib.parse import unquote_plus
 import re
-from collections import defaultdict
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/webhook", tags=["webhooks"])
 
-# Initialize services
-graph_service = GraphService()
-notion_service = NotionService()
-
-# Track subscription creation times for latency analysis
-# Key: request_id from validation token, Value: (subscription_creation_time, resource)
-_subscription_creation_times: Dict[str, Tuple[float, str]] = {}
-
 # Track recent messages for reaction polling (since Graph doesn't send "updated" for reactions)
 # Key: (team_id, channel_id, message_id), Value: timestamp when message was created
 _recent_messages: Dict[Tuple[str, str, str], float] = {}
 
+# Debounce window for repeated notifications about the same message
+NOTIFICATION_DEBOUNCE_SECONDS = 30
+
+# Messages scheduled for processing within the debounce window
+# Key: (team_id, channel_id, message_id)
+_recently_scheduled: TTLCache = TTLCache(maxsize=10_000, ttl=NOTIFICATION_DEBOUNCE_SECONDS)
+
+# Bounded queue feeding a fixed pool of reaction processing workers
+REACTION_QUEUE_SIZE = 5000
+REACTION_WORKER_COUNT = 8
+_reaction_queue: "asyncio.Queue[ChangeNotification]" = asyncio.Queue(maxsize=REACTION_QUEUE_SIZE)
+_worker_tasks: List[asyncio.Task] = []
+
+# Message IDs with a ticket creation in progress; the worker pool and the polling
+# loop can both reach the same message, and ticket_exists is not atomic with the create
+_tickets_in_flight: Set[str] = set()
+
 # Ticket emoji to look for
 TICKET_EMOJI = "🎫"
 
@@ -40,6 +53,28 @@ REACTION_POLL_INTERVAL = 30
 # How long to keep messages in the polling queue (5 minutes)
 MESSAGE_POLL_RETENTION = 300
 
+# Resource URL formats sent by Microsoft Graph
+# Standard format: /teams/{teamId}/channels/{channelId}/messages/{messageId}
+_RESOURCE_RE = re.compile(r"/teams/([^/]+)/channels/([^/]+)/messages/([^/]+)", re.IGNORECASE)
+# Notification format: teams('{teamId}')/channels('{channelId}')/messages('{messageId}')
+# Flexible about optional whitespace and case variations
+_GRAPH_RESOURCE_RE = re.compile(
+    r"teams\s*\(\s*'([^']+)'\s*\)\s*/channels\s*\(\s*'([^']+)'\s*\)\s*/messages\s*\(\s*'([^']+)'\s*\)",
+    re.IGNORECASE
+)
+
+# validationToken query parameter, matched directly against the raw ASGI query bytes
+_VALIDATION_TOKEN_RE = re.compile(rb"(?:^|&)validationToken=([^&]*)")
+
+# Request-Id embedded in Graph's validation token text
+_REQUEST_ID_RE = re.compile(r"Request-Id:\s*\+?(\S+)")
+
+# Shared 202 ACK - Response objects aren't mutated when sent, so one instance serves every request
+_OK_202 = PlainTextResponse("OK", status_code=202)
+
+# Message change types that can carry a new ticket reaction
+_MESSAGE_CHANGE_TYPES = frozenset({"created", "updated"})
+
 
 def extract_team_channel_from_resource(resource: str) -> Optional[Tuple[str, str, str]]:
     """
@@ -49,74 +84,183 @@ def extract_team_channel_from_resource(resource: str) -> Optional[Tuple[str, str
     1. Standard format: /teams/{teamId}/channels/{channelId}/messages/{messageId}
     2. Notification format: teams('{teamId}')/channels('{channelId}')/messages('{messageId}')
     
+    Parsed results are memoized since Graph frequently re-sends the same resource
+    (retries, duplicate notifications, polling).
+    
     Args:
         resource: Resource URL from webhook notification
         
     Returns:
         Tuple of (team_id, channel_id, message_id) or None if parsing fails
     """
+    parsed = _parse_resource_cached(resource)
+    if parsed is None:
+        # If both patterns fail, log the resource for debugging
+        logger.warning(f"Failed to parse resource with both patterns. Resource: {resource}")
+    return parsed
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_resource_cached(resource: str) -> Optional[Tuple[str, str, str]]:
+    """Run the resource regexes once per unique resource string."""
     # Debug: Log the exact resource format received
-    logger.debug(f"Parsing resource: {resource[:200]}...")  # Log first 200 chars to avoid huge logs
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Parsing resource: %s...", resource[:200])  # Log first 200 chars to avoid huge logs
     
     # Try standard format first: /teams/{teamId}/channels/{channelId}/messages/{messageId}
-    pattern1 = r"/teams/([^/]+)/channels/([^/]+)/messages/([^/]+)"
-    match = re.search(pattern1, resource, re.IGNORECASE)
+    match = _RESOURCE_RE.search(resource)
     if match:
-        team_id, channel_id, message_id = match.group(1), match.group(2), match.group(3)
-        logger.debug(f"Parsed resource (standard format): team={team_id}, channel={channel_id}, message={message_id}")
+        team_id, channel_id, message_id = map(sys.intern, match.groups())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parsed resource (standard format): team=%s, channel=%s, message=%s", team_id, channel_id, message_id)
         return team_id, channel_id, message_id
     
     # Try Graph notification format: teams('{teamId}')/channels('{channelId}')/messages('{messageId}')
-    # Make pattern more flexible to handle optional whitespace and case variations
-    pattern2 = r"teams\s*\(\s*'([^']+)'\s*\)\s*/channels\s*\(\s*'([^']+)'\s*\)\s*/messages\s*\(\s*'([^']+)'\s*\)"
-    match = re.search(pattern2, resource, re.IGNORECASE)
+    match = _GRAPH_RESOURCE_RE.search(resource)
     if match:
-        team_id, channel_id, message_id = match.group(1), match.group(2), match.group(3)
-        logger.debug(f"Parsed resource (Graph format): team={team_id}, channel={channel_id}, message={message_id}")
+        team_id, channel_id, message_id = map(sys.intern, match.groups())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parsed resource (Graph format): team=%s, channel=%s, message=%s", team_id, channel_id, message_id)
         return team_id, channel_id, message_id
     
-    # If both patterns fail, log the resource for debugging
-    logger.warning(f"Failed to parse resource with both patterns. Resource: {resource}")
     return None
 
 
-def extract_validation_token(request: Request, start_time: Optional[float] = None) -> Tuple[Optional[str], Optional[float]]:
+def strip_html_tags(content: str) -> str:
     """
-    Extract validation token from request query string.
+    Remove HTML tags from message content and decode HTML entities.
     
-    This is the fastest method for validation token extraction, checking query string
-    directly before falling back to query_params. Used by all validation endpoints.
+    Scans with str.find instead of the regex engine and skips plain-text
+    messages entirely. An unterminated '<' is kept as literal text.
     
     Args:
-        request: FastAPI Request object
-        start_time: Optional start time for performance measurement
+        content: Message body content (HTML or plain text)
+        
+    Returns:
+        Content with all <...> tags removed and entities (e.g. &amp;) decoded
+    """
+    if "<" in content:
+        parts = []
+        pos = 0
+        find = content.find
+        while True:
+            tag_start = find("<", pos)
+            if tag_start == -1:
+                break
+            tag_end = find(">", tag_start + 1)
+            if tag_end == -1:
+                break
+            if tag_end == tag_start + 1:
+                # "<>" is not a tag (the old <[^>]+> pattern required a body)
+                parts.append(content[pos:tag_end + 1])
+            else:
+                parts.append(content[pos:tag_start])
+            pos = tag_end + 1
+        parts.append(content[pos:])
+        content = "".join(parts)
+    
+    # Decode entities after stripping so an escaped "&lt;b&gt;" stays visible text
+    if "&" in content:
+        content = html.unescape(content)
+    return content
+
+
+def validation_response(validation_token: str) -> Response:
+    """
+    Build the plain text response echoing a validation token back to Graph.
+    
+    Encodes the token up front so Starlette skips its str rendering branch.
+    
+    Args:
+        validation_token: Decoded validation token
         
     Returns:
-        Tuple of (validation_token, response_time_ms) or (None, None) if no token found
-    """
-    if start_time is None:
-        start_time = time.perf_counter()
-    
-    query_string = request.url.query
-    if query_string and "validationToken=" in query_string:
-        # Extract token from query string directly (fastest method)
-        token_start = query_string.find("validationToken=") + len("validationToken=")
-        token_end = query_string.find("&", token_start)
-        if token_end == -1:
-            token_end = len(query_string)
+        200 text/plain response containing the token
+    """
+    return Response(content=validation_token.encode(), media_type="text/plain", status_code=200)
+
+
+def _parse_validation_token(query_bytes: bytes) -> Optional[str]:
+    """
+    Pull the validationToken value out of a raw query string in one regex scan.
+    
+    Args:
+        query_bytes: Raw ASGI query string
         
-        validation_token = unquote_plus(query_string[token_start:token_end])
-        response_time_ms = (time.perf_counter() - start_time) * 1000
-        return validation_token, response_time_ms
+    Returns:
+        Decoded validation token, or None if the parameter is absent
+    """
+    match = _VALIDATION_TOKEN_RE.search(query_bytes)
+    if not match:
+        return None
+    raw = match.group(1).decode("ascii", "replace")
+    # Most tokens carry no escapes, so skip the unquote pass when there is nothing to decode
+    if "%" in raw or "+" in raw:
+        return unquote_plus(raw)
+    return raw
+
+
+def extract_validation_token(request: Request) -> Optional[str]:
+    """
+    Extract validation token from request query string.
     
-    # Fallback to query_params
-    validation_token = request.query_params.get("validationToken")
+    This is the fastest method for validation token extraction, scanning the raw ASGI
+    query bytes directly before falling back to query_params. Used by all validation endpoints.
+    
+    Args:
+        request: FastAPI Request object
+        
+    Returns:
+        Validation token, or None if no token found
+    """
+    # Read the raw ASGI query bytes - avoids building a Starlette URL object
+    validation_token = _parse_validation_token(request.scope.get("query_string", b""))
     if validation_token:
-        validation_token = unquote_plus(validation_token)
-        response_time_ms = (time.perf_counter() - start_time) * 1000
-        return validation_token, response_time_ms
+        return validation_token
     
-    return None, None
+    # Fallback to query_params (values are already URL-decoded)
+    return request.query_params.get("validationToken") or None
+
+
+# Paths whose validation handshake is answered straight from ASGI, before FastAPI routing
+_ASGI_VALIDATION_PATHS = frozenset({"/graph/validate", "/webhook"})
+# Methods those routes accept; anything else falls through to routing (and its 405)
+_ASGI_VALIDATION_METHODS = frozenset({"GET", "POST"})
+
+
+class ValidationFastPathMiddleware:
+    """
+    Raw ASGI middleware answering Graph validation handshakes on the hot paths.
+    
+    GET/POST requests to /graph/validate and /webhook carrying a validationToken are answered
+    with a single pre-built response start + body send, skipping FastAPI routing,
+    dependency resolution, and the remaining middleware stack. Everything else is
+    passed through untouched.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] == "http"
+            and scope["path"] in _ASGI_VALIDATION_PATHS
+            and scope["method"] in _ASGI_VALIDATION_METHODS
+        ):
+            token = _parse_validation_token(scope.get("query_string", b""))
+            if token:
+                body = token.encode()
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"text/plain; charset=utf-8"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                })
+                await send({"type": "http.response.body", "body": body})
+                return
+        await self.app(scope, receive, send)
 
 
 async def parse_notification_body(request: Request) -> Tuple[Optional[Notification], Optional[Response]]:
@@ -125,6 +269,7 @@ async def parse_notification_body(request: Request) -> Tuple[Optional[Notificati
     
     Handles empty bodies, JSON parsing, and error cases gracefully.
     Returns 202 Accepted for empty bodies or parsing errors to avoid Graph blacklisting.
+    The body is read once and validated directly from bytes (no request.json() pass).
     
     Args:
         request: FastAPI Request object
@@ -140,17 +285,15 @@ async def parse_notification_body(request: Request) -> Tuple[Optional[Notificati
         if not body:
             # Microsoft Graph sometimes sends empty POSTs during reachability checks
             # NEVER return 4xx here - Graph treats ANY 4xx as validation failure
-            return None, PlainTextResponse("OK", status_code=202)
+            return None, _OK_202
         
-        notification_data = await request.json()
-        notification = Notification(**notification_data)
+        # Decode + validate straight from the already-read body (orjson via model config)
+        notification = Notification.parse_raw(body)
         return notification, None
-    except HTTPException:
-        raise
     except Exception as e:
         logger.error(f"Failed to parse notification: {str(e)}")
         # Even for parsing errors, return 202 to avoid Graph blacklisting
-        return None, PlainTextResponse("OK", status_code=202)
+        return None, _OK_202
 
 
 @router.api_route("", methods=["GET", "POST"])
@@ -162,12 +305,14 @@ async def webhook_root(request: Request):
     This endpoint catches those validation requests and responds immediately.
     
     CRITICAL: Must respond in < 2 seconds to avoid validation timeout.
-    Optimized for fastest possible response.
+    Optimized for fastest possible response. When ValidationFastPathMiddleware is
+    installed, validation requests are answered before reaching this handler.
     """
-    validation_token, response_time_ms = extract_validation_token(request)
+    validation_token = extract_validation_token(request)
     if validation_token:
-        logger.info(f"POST /webhook (root) - Validation request received, response time: {response_time_ms:.2f}ms")
-        return PlainTextResponse(content=validation_token, status_code=200)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("POST /webhook (root) - Validation request received")
+        return validation_response(validation_token)
     
     # If no validation token, return 404 (not a valid endpoint for notifications)
     raise HTTPException(status_code=404, detail="Use /webhook/notification or /webhook/lifecycle for notifications")
@@ -190,162 +335,60 @@ async def poll_messages_for_reactions():
             if not messages_to_check:
                 continue
             
-            logger.info(f"Polling {len(messages_to_check)} message(s) for reactions...")
+            # Remove old messages (older than retention period)
+            refs = []
+            for ref, created_time in messages_to_check:
+                if current_time - created_time > MESSAGE_POLL_RETENTION:
+                    logger.info(f"Removing old message {ref[2]} from polling queue (age: {current_time - created_time:.0f}s)")
+                    _recent_messages.pop(ref, None)
+                else:
+                    refs.append(ref)
+            
+            if not refs:
+                continue
+            
+            logger.info("Polling %d message(s) for reactions...", len(refs))
+            
+            # Fetch all polled messages in Graph $batch calls (20 per round-trip)
+            messages = await graph_service.get_messages_bulk(refs)
             
             # Check each message
-            for (team_id, channel_id, message_id), created_time in messages_to_check:
-                # Remove old messages (older than retention period)
-                if current_time - created_time > MESSAGE_POLL_RETENTION:
-                    logger.info(f"Removing old message {message_id} from polling queue (age: {current_time - created_time:.0f}s)")
-                    _recent_messages.pop((team_id, channel_id, message_id), None)
-                    continue
-                
+            for (team_id, channel_id, message_id) in refs:
                 try:
-                    # Fetch message to check for reactions
-                    logger.debug(f"Polling message {message_id} for reactions...")
-                    message = graph_service.get_message(team_id, channel_id, message_id)
+                    message = messages[(team_id, channel_id, message_id)]
+                    if isinstance(message, Exception):
+                        raise message
                     
                     # Check for ticket emoji reaction
                     ticket_reaction = None
                     if message.reactions:
-                        logger.info(f"Message {message_id} has {len(message.reactions)} reaction(s) during polling")
+                        logger.info("Message %s has %d reaction(s) during polling", message_id, len(message.reactions))
+                        debug_enabled = logger.isEnabledFor(logging.DEBUG)
                         for reaction in message.reactions:
-                            logger.debug(f"Found reaction type: {reaction.reactionType}")
+                            if debug_enabled:
+                                logger.debug("Found reaction type: %s", reaction.reactionType)
                             if reaction.reactionType == TICKET_EMOJI:
                                 ticket_reaction = reaction
                                 break
                     else:
-                        logger.debug(f"Message {message_id} has no reactions during polling")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Message %s has no reactions during polling", message_id)
                     
                     if ticket_reaction:
                         logger.info(f"Polling detected ticket emoji (🎫) reaction on message {message_id}")
-                        # Remove from polling queue immediately
-                        _recent_messages.pop((team_id, channel_id, message_id), None)
                         
                         # Process the reaction directly (we already have the message and reaction)
                         # This avoids re-fetching and potential race conditions
                         try:
-                            # Get user who added the reaction
-                            reacting_user = ticket_reaction.user
-                            if not reacting_user:
-                                logger.warning(f"Reaction user object is None for message {message_id}")
-                                continue
-                            
-                            # The reaction.user structure can be:
-                            # Option 1: Direct user dict: {'id': '...', 'displayName': None, ...}
-                            # Option 2: Nested structure: {'application': None, 'device': None, 'user': {'id': '...', ...}}
-                            # Extract user ID (Azure AD object ID)
-                            reacting_user_id = None
-                            if isinstance(reacting_user, dict):
-                                # Try nested structure first (user.user.id)
-                                nested_user = reacting_user.get("user")
-                                if isinstance(nested_user, dict):
-                                    reacting_user_id = nested_user.get("id")
-                                
-                                # Fallback to direct id
-                                if not reacting_user_id:
-                                    reacting_user_id = reacting_user.get("id")
-                            
-                            if not reacting_user_id:
-                                logger.warning(f"Could not extract user ID from reaction: {reacting_user}")
-                                continue
-                            
-                            logger.info(f"Extracted reacting user ID: {reacting_user_id}")
-                            
-                            # Use the user ID to fetch user info (which will give us the email)
-                            try:
-                                user_info = graph_service.get_user_info(reacting_user_id)
-                                reacting_user_email = user_info.get("mail") or user_info.get("userPrincipalName") or reacting_user_id
-                                reacting_user_email = normalize_email(reacting_user_email)
-                                approved_by_name = user_info.get("displayName")
-                                approved_by_email = reacting_user_email
-                                logger.info(f"Fetched user email: {reacting_user_email}")
-                            except Exception as e:
-                                logger.warning(f"Could not fetch user info for ID {reacting_user_id}: {str(e)}")
-                                # Fallback to using the ID directly
-                                reacting_user_email = normalize_email(reacting_user_id)
-                                approved_by_name = None
-                                approved_by_email = reacting_user_email
-                            
-                            # Check if user is allowed
-                            if not is_user_allowed(reacting_user_email):
-                                logger.info(f"User {reacting_user_email} is not allowed to create tickets")
-                                continue
-                            
-                            # Get message author details
-                            requester_email = None
-                            requester_name = None
-                            if message.from_ and message.from_.user:
-                                requester_id = message.from_.user.get("id")
-                                if requester_id:
-                                    try:
-                                        requester_info = graph_service.get_user_info(requester_id)
-                                        requester_name = requester_info.get("displayName")
-                                        requester_email = requester_info.get("mail") or requester_info.get("userPrincipalName") or requester_id
-                                        requester_email = normalize_email(requester_email)
-                                    except Exception as e:
-                                        logger.warning(f"Could not fetch requester info: {str(e)}")
-                                        requester_email = requester_id
-                            
-                            if not requester_email:
-                                logger.warning(f"Could not determine requester for message {message_id}")
-                                requester_email = "Unknown"
-                            
-                            # Get channel info
-                            try:
-                                channel_info = graph_service.get_channel_info(team_id, channel_id)
-                                channel_name = channel_info.get("displayName", channel_id)
-                            except Exception as e:
-                                logger.warning(f"Could not fetch channel info: {str(e)}")
-                                channel_name = channel_id
-                            
-                            # Extract message content
-                            message_body = ""
-                            if message.body:
-                                message_body = message.body.content or ""
-                                message_body = re.sub(r'<[^>]+>', '', message_body)
-                            
-                            # Extract task title
-                            task_title = message.subject or "Teams Ticket"
-                            if not message.subject and message_body:
-                                first_line = message_body.split('\n')[0].strip()
-                                task_title = first_line[:100] if first_line else "Teams Ticket"
-                            
-                            # Get attachments
-                            attachments = []
-                            if message.attachments:
-                                for attachment in message.attachments:
-                                    if attachment.contentUrl:
-                                        attachments.append(attachment.contentUrl)
-                            
-                            # Get reaction timestamp
-                            approved_at = message.lastModifiedDateTime or datetime.now(timezone.utc)
-                            if isinstance(approved_at, str):
-                                try:
-                                    approved_at = datetime.fromisoformat(approved_at.replace('Z', '+00:00'))
-                                except:
-                                    approved_at = datetime.now(timezone.utc)
-                            
-                            # Create ticket in Notion
-                            logger.info(f"Creating Notion ticket for message {message_id} (from polling)")
-                            notion_service.create_ticket(
-                                task_title=task_title,
-                                description=message_body,
-                                requester_email=requester_email,
-                                requester_name=requester_name,
-                                teams_message_id=message_id,
-                                teams_channel=channel_name,
-                                attachments=attachments,
-                                approved_by_email=approved_by_email,
-                                approved_by_name=approved_by_name,
-                                approved_at=approved_at,
-                            )
-                            
-                            logger.info(f"Successfully created Notion ticket for message {message_id} (from polling)")
-                            
+                            if await create_ticket_for_reaction(
+                                team_id, channel_id, message_id, message, ticket_reaction, source=" (from polling)"
+                            ):
+                                # Remove from polling queue since ticket was created
+                                _recent_messages.pop((team_id, channel_id, message_id), None)
                         except ValueError as e:
-                            # Duplicate ticket - this is expected
+                            # Duplicate ticket - this is expected, nothing left to poll for
                             logger.info(f"Ticket already exists: {str(e)}")
+                            _recent_messages.pop((team_id, channel_id, message_id), None)
                         except Exception as e:
                             logger.error(f"Error processing reaction from polling: {str(e)}", exc_info=True)
                         
@@ -358,6 +401,207 @@ async def poll_messages_for_reactions():
             await asyncio.sleep(REACTION_POLL_INTERVAL)
 
 
+def _email_from_user_info(user_info: Dict[str, Any], user_id: str) -> str:
+    """Pick the best email field from a Graph user object, falling back to the ID."""
+    return normalize_email(user_info.get("mail") or user_info.get("userPrincipalName") or user_id)
+
+
+async def create_ticket_for_reaction(
+    team_id: str,
+    channel_id: str,
+    message_id: str,
+    message: GraphMessage,
+    ticket_reaction: MessageReaction,
+    source: str = ""
+) -> bool:
+    """
+    Create a Notion ticket for a message, unless one is already being created for it.
+    
+    Args:
+        team_id: Team ID
+        channel_id: Channel ID
+        message_id: Message ID
+        message: Message with reactions
+        ticket_reaction: The ticket emoji reaction
+        source: Suffix for log messages (e.g. " (from polling)")
+        
+    Returns:
+        True if a ticket was created, False if the reaction was skipped
+    """
+    # Check-and-add runs without an await in between, so it is atomic on the event loop
+    if message_id in _tickets_in_flight:
+        logger.info(f"Ticket creation already in progress for message {message_id}{source}, skipping")
+        return False
+    
+    _tickets_in_flight.add(message_id)
+    try:
+        return await _create_ticket_for_reaction(
+            team_id, channel_id, message_id, message, ticket_reaction, source
+        )
+    finally:
+        _tickets_in_flight.discard(message_id)
+
+
+async def _create_ticket_for_reaction(
+    team_id: str,
+    channel_id: str,
+    message_id: str,
+    message: GraphMessage,
+    ticket_reaction: MessageReaction,
+    source: str = ""
+) -> bool:
+    """
+    Create a Notion ticket for a message that has a ticket emoji reaction.
+    
+    The approver, requester, and channel lookups are independent, so they are
+    fetched from Graph in one $batch request.
+    
+    Args:
+        team_id: Team ID
+        channel_id: Channel ID
+        message_id: Message ID
+        message: Message with reactions
+        ticket_reaction: The ticket emoji reaction
+        source: Suffix for log messages (e.g. " (from polling)")
+        
+    Returns:
+        True if a ticket was created, False if the reaction was skipped
+        
+    Raises:
+        ValueError: If a ticket for this message already exists
+    """
+    # Get user who added the reaction
+    reacting_user = ticket_reaction.user
+    if not reacting_user:
+        logger.warning(f"Reaction user object is None for message {message_id}")
+        return False
+    
+    # The reaction.user structure can be:
+    # Option 1: Direct user dict: {'id': '...', 'displayName': None, ...}
+    # Option 2: Nested structure: {'application': None, 'device': None, 'user': {'id': '...', ...}}
+    # Extract user ID (Azure AD object ID)
+    reacting_user_id = None
+    if isinstance(reacting_user, dict):
+        # Try nested structure first (user.user.id)
+        nested_user = reacting_user.get("user")
+        if isinstance(nested_user, dict):
+            reacting_user_id = nested_user.get("id")
+        
+        # Fallback to direct id
+        if not reacting_user_id:
+            reacting_user_id = reacting_user.get("id")
+    
+    if not reacting_user_id:
+        logger.warning(f"Could not extract user ID from reaction: {reacting_user}")
+        return False
+    
+    logger.info(f"Extracted reacting user ID: {reacting_user_id}")
+    
+    requester_id = None
+    if message.from_ and message.from_.user:
+        requester_id = message.from_.user.get("id")
+    
+    # Fetch approver, requester, and channel info in a single Graph $batch round-trip
+    # (cached lookups are served locally; only misses go to Graph)
+    lookups = {
+        "approver": f"/users/{reacting_user_id}",
+        "channel": f"/teams/{team_id}/channels/{channel_id}",
+    }
+    # Self-reacts (approver == requester) reuse the approver lookup instead of a second /users call
+    self_react = requester_id == reacting_user_id
+    if requester_id and not self_react:
+        lookups["requester"] = f"/users/{requester_id}"
+    results = await graph_service.batch_get(lookups, cached=True)
+    user_info = results["approver"]
+    channel_info = results["channel"]
+    requester_info = user_info if self_react else results.get("requester")
+    
+    # Use the user info to get the approver's email
+    if isinstance(user_info, Exception):
+        logger.warning(f"Could not fetch user info for ID {reacting_user_id}: {str(user_info)}")
+        # Fallback to using the ID directly
+        approver_address = reacting_user_id
+        approved_by_name = None
+    else:
+        approver_address = _email_from_user_info(user_info, reacting_user_id)
+        approved_by_name = user_info.get("displayName")
+    
+    # Canonicalize and check the allow-list in one pass
+    allowed, reacting_user_email = check_user(approver_address)
+    if not isinstance(user_info, Exception):
+        logger.info(f"Fetched user email: {reacting_user_email}")
+    approved_by_email = reacting_user_email
+    
+    # Check if user is allowed
+    if not allowed:
+        logger.info(f"User {reacting_user_email} is not allowed to create tickets")
+        return False
+    
+    # Get message author details
+    requester_email = None
+    requester_name = None
+    if requester_id:
+        if isinstance(requester_info, Exception):
+            logger.warning(f"Could not fetch requester info: {str(requester_info)}")
+            requester_email = normalize_email(requester_id)
+        else:
+            requester_name = requester_info.get("displayName")
+            requester_email = _email_from_user_info(requester_info, requester_id)
+    
+    if not requester_email:
+        logger.warning(f"Could not determine requester for message {message_id}")
+        requester_email = "Unknown"
+    
+    # Get channel info
+    if isinstance(channel_info, Exception):
+        logger.warning(f"Could not fetch channel info: {str(channel_info)}")
+        channel_name = channel_id
+    else:
+        channel_name = channel_info.get("displayName", channel_id)
+    
+    # Extract message content
+    message_body = ""
+    if message.body:
+        # Strip HTML tags for cleaner text (basic)
+        message_body = strip_html_tags(message.body.content or "")
+    
+    # Extract task title from subject or first line of message
+    task_title = message.subject or "Teams Ticket"
+    if not message.subject and message_body:
+        # Use first line or first 100 chars as title
+        first_line = message_body.split('\n')[0].strip()
+        task_title = first_line[:100] if first_line else "Teams Ticket"
+    
+    # Get attachments
+    attachments = []
+    if message.attachments:
+        for attachment in message.attachments:
+            if attachment.contentUrl:
+                attachments.append(attachment.contentUrl)
+    
+    # Get reaction timestamp (use message last modified or current time)
+    # GraphMessage already parses lastModifiedDateTime into a datetime during validation
+    approved_at = message.lastModifiedDateTime or datetime.now(timezone.utc)
+    
+    # Create ticket in Notion
+    logger.info(f"Creating Notion ticket for message {message_id}{source}")
+    await notion_service.create_ticket(
+        task_title=task_title,
+        description=message_body,
+        requester_email=requester_email,
+        requester_name=requester_name,
+        teams_message_id=message_id,
+        teams_channel=channel_name,
+        attachments=attachments,
+        approved_by_email=approved_by_email,
+        approved_by_name=approved_by_name,
+        approved_at=approved_at,
+    )
+    
+    logger.info(f"Successfully created Notion ticket for message {message_id}{source}")
+    return True
+
+
 async def process_message_reaction(notification: ChangeNotification) -> None:
     """
     Process a message reaction notification.
@@ -376,17 +620,19 @@ async def process_message_reaction(notification: ChangeNotification) -> None:
         
         # Fetch full message details including reactions
         logger.info(f"Fetching message {message_id} from team {team_id}, channel {channel_id}")
-        message = graph_service.get_message(team_id, channel_id, message_id)
+        message = await graph_service.get_message(team_id, channel_id, message_id)
         
         # Check if ticket emoji reaction exists
         ticket_reaction = None
         if message.reactions:
-            logger.info(f"Message {message_id} has {len(message.reactions)} reaction(s)")
+            logger.info("Message %s has %d reaction(s)", message_id, len(message.reactions))
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             for reaction in message.reactions:
-                logger.debug(f"Found reaction: {reaction.reactionType}")
+                if debug_enabled:
+                    logger.debug("Found reaction: %s", reaction.reactionType)
                 if reaction.reactionType == TICKET_EMOJI:
                     ticket_reaction = reaction
-                    logger.info(f"Found ticket emoji (🎫) reaction on message {message_id}")
+                    logger.info("Found ticket emoji (🎫) reaction on message %s", message_id)
                     break
         else:
             logger.info(f"Message {message_id} has no reactions")
@@ -397,136 +643,69 @@ async def process_message_reaction(notification: ChangeNotification) -> None:
             _recent_messages[(team_id, channel_id, message_id)] = time.time()
             return
         
-        # Get user who added the reaction
-        reacting_user = ticket_reaction.user
-        if not reacting_user:
-            logger.warning(f"Reaction user object is None for message {message_id}")
-            return
-        
-        # The reaction.user structure can be:
-        # Option 1: Direct user dict: {'id': '...', 'displayName': None, ...}
-        # Option 2: Nested structure: {'application': None, 'device': None, 'user': {'id': '...', ...}}
-        # Extract user ID (Azure AD object ID)
-        reacting_user_id = None
-        if isinstance(reacting_user, dict):
-            # Try nested structure first (user.user.id)
-            nested_user = reacting_user.get("user")
-            if isinstance(nested_user, dict):
-                reacting_user_id = nested_user.get("id")
-            
-            # Fallback to direct id
-            if not reacting_user_id:
-                reacting_user_id = reacting_user.get("id")
-        
-        if not reacting_user_id:
-            logger.warning(f"Could not extract user ID from reaction: {reacting_user}")
-            return
-        
-        logger.info(f"Extracted reacting user ID: {reacting_user_id}")
-        
-        # Use the user ID to fetch user info (which will give us the email)
-        try:
-            user_info = graph_service.get_user_info(reacting_user_id)
-            reacting_user_email = user_info.get("mail") or user_info.get("userPrincipalName") or reacting_user_id
-            reacting_user_email = normalize_email(reacting_user_email)
-            approved_by_name = user_info.get("displayName")
-            approved_by_email = reacting_user_email
-            logger.info(f"Fetched user email: {reacting_user_email}")
-        except Exception as e:
-            logger.warning(f"Could not fetch user info for ID {reacting_user_id}: {str(e)}")
-            # Fallback to using the ID directly
-            reacting_user_email = normalize_email(reacting_user_id)
-            approved_by_name = None
-            approved_by_email = reacting_user_email
-        
-        # Check if user is allowed
-        if not is_user_allowed(reacting_user_email):
-            logger.info(f"User {reacting_user_email} is not allowed to create tickets")
-            return
-        
-        # Get message author details
-        requester_email = None
-        requester_name = None
-        if message.from_ and message.from_.user:
-            requester_id = message.from_.user.get("id")
-            if requester_id:
-                try:
-                    requester_info = graph_service.get_user_info(requester_id)
-                    requester_name = requester_info.get("displayName")
-                    requester_email = requester_info.get("mail") or requester_info.get("userPrincipalName") or requester_id
-                    requester_email = normalize_email(requester_email)
-                except Exception as e:
-                    logger.warning(f"Could not fetch requester info: {str(e)}")
-                    requester_email = normalize_email(requester_id)
-        
-        if not requester_email:
-            logger.warning(f"Could not determine requester for message {message_id}")
-            requester_email = "Unknown"
-        
-        # Get channel info
-        try:
-            channel_info = graph_service.get_channel_info(team_id, channel_id)
-            channel_name = channel_info.get("displayName", channel_id)
-        except Exception as e:
-            logger.warning(f"Could not fetch channel info: {str(e)}")
-            channel_name = channel_id
-        
-        # Extract message content
-        message_body = ""
-        if message.body:
-            message_body = message.body.content or ""
-            # Strip HTML tags for cleaner text (basic)
-            message_body = re.sub(r'<[^>]+>', '', message_body)
-        
-        # Extract task title from subject or first line of message
-        task_title = message.subject or "Teams Ticket"
-        if not message.subject and message_body:
-            # Use first line or first 100 chars as title
-            first_line = message_body.split('\n')[0].strip()
-            task_title = first_line[:100] if first_line else "Teams Ticket"
-        
-        # Get attachments
-        attachments = []
-        if message.attachments:
-            for attachment in message.attachments:
-                if attachment.contentUrl:
-                    attachments.append(attachment.contentUrl)
-        
-        # Get reaction timestamp (use message last modified or current time)
-        approved_at = message.lastModifiedDateTime or datetime.now(timezone.utc)
-        if isinstance(approved_at, str):
-            # Parse ISO format string
-            try:
-                approved_at = datetime.fromisoformat(approved_at.replace('Z', '+00:00'))
-            except:
-                approved_at = datetime.now(timezone.utc)
-        
-        # Create ticket in Notion
-        logger.info(f"Creating Notion ticket for message {message_id}")
-        notion_service.create_ticket(
-            task_title=task_title,
-            description=message_body,
-            requester_email=requester_email,
-            requester_name=requester_name,
-            teams_message_id=message_id,
-            teams_channel=channel_name,
-            attachments=attachments,
-            approved_by_email=approved_by_email,
-            approved_by_name=approved_by_name,
-            approved_at=approved_at,
-        )
-        
-        logger.info(f"Successfully created Notion ticket for message {message_id}")
-        
-        # Remove from polling queue since ticket was created
-        _recent_messages.pop((team_id, channel_id, message_id), None)
+        if await create_ticket_for_reaction(team_id, channel_id, message_id, message, ticket_reaction):
+            # Remove from polling queue since ticket was created
+            _recent_messages.pop((team_id, channel_id, message_id), None)
         
     except ValueError as e:
         # Duplicate ticket - this is expected, just log
         logger.info(f"Ticket already exists: {str(e)}")
     except Exception as e:
         logger.error(f"Error processing message reaction: {str(e)}", exc_info=True)
-        raise
+
+
+async def _reaction_worker() -> None:
+    """Take queued change notifications and process them one at a time."""
+    while True:
+        notification = await _reaction_queue.get()
+        try:
+            await process_message_reaction(notification)
+        finally:
+            _reaction_queue.task_done()
+
+
+def start_reaction_workers(count: int = REACTION_WORKER_COUNT) -> None:
+    """
+    Start the worker pool that drains the reaction processing queue.
+    
+    Must be called from the running event loop (app startup).
+    
+    Args:
+        count: Number of concurrent workers
+    """
+    for _ in range(count):
+        _worker_tasks.append(asyncio.create_task(_reaction_worker()))
+    logger.info(f"Started {count} reaction processing worker(s)")
+
+
+async def stop_reaction_workers() -> None:
+    """Cancel the reaction worker pool (app shutdown)."""
+    for task in _worker_tasks:
+        task.cancel()
+    await asyncio.gather(*_worker_tasks, return_exceptions=True)
+    _worker_tasks.clear()
+
+
+def schedule_reaction_processing(notification: ChangeNotification) -> bool:
+    """
+    Queue a change notification for background reaction processing.
+    
+    The queue is bounded, so a notification burst applies backpressure instead
+    of spawning unbounded concurrent Graph/Notion calls.
+    
+    Args:
+        notification: Change notification from webhook
+        
+    Returns:
+        True if the notification was queued, False if it was dropped (queue full)
+    """
+    try:
+        _reaction_queue.put_nowait(notification)
+        return True
+    except asyncio.QueueFull:
+        # The notification was already acknowledged, so Graph won't redeliver it
+        logger.warning(f"Reaction queue full - dropping notification for resource: {notification.resource}")
+        return False
 
 
 @router.get("/validation")
@@ -545,8 +724,9 @@ def webhook_validation(validationToken: Optional[str] = None):
         Validation token as plain text
     """
     if validationToken:
-        logger.info(f"GET /webhook/validation - Validation request received")
-        return PlainTextResponse(content=validationToken, status_code=200)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GET /webhook/validation - Validation request received")
+        return validation_response(validationToken)
     else:
         raise HTTPException(status_code=400, detail="Missing validationToken")
 
@@ -566,8 +746,9 @@ def webhook_lifecycle_validation(validationToken: Optional[str] = None) -> Respo
         Validation token as plain text
     """
     if validationToken:
-        logger.info(f"GET /webhook/lifecycle/validation - Validation request received")
-        return PlainTextResponse(content=validationToken, status_code=200)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GET /webhook/lifecycle/validation - Validation request received")
+        return validation_response(validationToken)
     else:
         raise HTTPException(status_code=400, detail="Missing validationToken")
 
@@ -584,19 +765,26 @@ async def webhook_lifecycle(request: Request):
     Returns:
         Success response or validation token
     """
-    start_time = time.perf_counter()
-    validation_token, response_time_ms = extract_validation_token(request, start_time)
+    # Timing and logging only run at DEBUG level to keep the validation path minimal
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    start_time = time.perf_counter() if debug_enabled else 0.0
+    validation_token = extract_validation_token(request)
     if validation_token:
-        logger.info(f"POST /webhook/lifecycle - Validation request received, response time: {response_time_ms:.2f}ms")
-        if response_time_ms > 100:
-            logger.warning(f"POST /webhook/lifecycle - Slow validation response time: {response_time_ms:.2f}ms (should be < 100ms)")
-        return PlainTextResponse(content=validation_token, status_code=200)
+        if debug_enabled:
+            response_time_ms = (time.perf_counter() - start_time) * 1000
+            logger.debug("POST /webhook/lifecycle - Validation request received, response time: %.2fms", response_time_ms)
+            if response_time_ms > 100:
+                logger.warning("POST /webhook/lifecycle - Slow validation response time: %.2fms (should be < 100ms)", response_time_ms)
+        return validation_response(validation_token)
     
     # Parse notification body
     notification, error_response = await parse_notification_body(request)
     if error_response:
         return error_response
     
+    if not notification.value:
+        return _OK_202
+    
     logger.info(f"Received lifecycle notification with {len(notification.value)} change(s)")
     
     # Process lifecycle events (subscription expiration, etc.)
@@ -608,26 +796,24 @@ async def webhook_lifecycle(request: Request):
             if change.changeType == "reauthorizationRequired":
                 logger.info(f"Subscription {change.subscriptionId} requires reauthorization - attempting renewal")
                 try:
-                    from services.graph_service import GraphService
-                    from datetime import datetime, timedelta, timezone
+                    from datetime import timedelta
                     from config import settings
                     
                     # Check if auto-renewal is enabled
                     auto_renew_enabled = getattr(settings, 'auto_renew_subscriptions', True)
                     if auto_renew_enabled:
-                        graph_service = GraphService()
                         # Renew for ~57 minutes (Teams max is 60 min)
                         renewal_minutes = getattr(settings, 'subscription_renewal_minutes', 57)
                         new_expiration = datetime.now(timezone.utc) + timedelta(minutes=renewal_minutes)
-                        graph_service.renew_subscription(change.subscriptionId, new_expiration)
+                        await graph_service.renew_subscription(change.subscriptionId, new_expiration)
                         logger.info(f"Successfully renewed subscription {change.subscriptionId} for {renewal_minutes} minutes")
                     else:
                         logger.info(f"Auto-renewal disabled - skipping renewal for subscription {change.subscriptionId}")
                 except Exception as renew_error:
                     logger.error(f"Failed to renew subscription {change.subscriptionId}: {renew_error}")
             
-            # Handle subscription expiration/removal
-            elif change.changeType == "subscriptionRemoved" or "expired" in change.changeType.lower():
+            # Handle subscription removal (Graph has no separate "expired" lifecycle event)
+            elif change.changeType == "subscriptionRemoved":
                 logger.warning(f"Subscription {change.subscriptionId} has expired or been removed")
             
             # Handle missed notifications
@@ -637,7 +823,7 @@ async def webhook_lifecycle(request: Request):
         except Exception as e:
             logger.error(f"Error processing lifecycle notification: {str(e)}", exc_info=True)
     
-    return PlainTextResponse("OK", status_code=202)
+    return _OK_202
 
 
 @router.post("/notification", response_model=None)
@@ -648,29 +834,33 @@ async def webhook_notification(request: Request):
     Optimized for fastest possible validation response.
     
     CRITICAL: Must respond in < 2 seconds to avoid validation timeout.
+    The service is launched with uvloop + httptools (see Dockerfile / main.py)
+    as part of meeting this budget.
     
     Returns:
         Success response or validation token
     """
-    start_time = time.perf_counter()
-    validation_arrival_time = time.time()
-    validation_token, response_time_ms = extract_validation_token(request, start_time)
+    # Timing and logging only run at DEBUG level to keep the validation path minimal
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    start_time = time.perf_counter() if debug_enabled else 0.0
+    # Monotonic clock, matching subscription tracking - immune to wall-clock jumps
+    validation_arrival_time = time.monotonic()
+    validation_token = extract_validation_token(request)
     
     if validation_token:
         # Extract request-id from validation token for latency tracking
         # Format: "Validation: Testing client application reachability for subscription Request-Id: {request-id}"
+        # Skipped unless there is a tracked subscription creation it could match
         request_id = None
-        if "Request-Id:" in validation_token:
-            try:
-                request_id = validation_token.split("Request-Id:")[-1].strip().lstrip('+')
-            except:
-                pass
-        
-        logger.info(f"POST /webhook/notification - Validation request received, response time: {response_time_ms:.2f}ms")
+        if has_tracked_subscriptions() or debug_enabled:
+            match = _REQUEST_ID_RE.search(validation_token)
+            request_id = match.group(1) if match else None
         
         # Track network latency if we have request-id and subscription creation time
-        if request_id and request_id in _subscription_creation_times:
-            creation_time, resource = _subscription_creation_times[request_id]
+        entry = pop_subscription_creation(request_id) if request_id else None
+        
+        if entry:
+            creation_time, resource = entry
             network_latency = validation_arrival_time - creation_time
             network_latency_ms = network_latency * 1000
             logger.warning(
@@ -678,15 +868,16 @@ async def webhook_notification(request: Request):
                 f"({network_latency:.2f}s) after subscription creation for resource: {resource}. "
                 f"Request-ID: {request_id}"
             )
-            # Clean up old entry
-            del _subscription_creation_times[request_id]
         elif request_id:
             logger.info(f"Validation request received with Request-ID: {request_id} (no matching subscription creation found)")
         
-        if response_time_ms > 100:
-            logger.warning(f"POST /webhook/notification - Slow validation response time: {response_time_ms:.2f}ms (should be < 100ms)")
+        if debug_enabled:
+            response_time_ms = (time.perf_counter() - start_time) * 1000
+            logger.debug("POST /webhook/notification - Validation request received, response time: %.2fms", response_time_ms)
+            if response_time_ms > 100:
+                logger.warning("POST /webhook/notification - Slow validation response time: %.2fms (should be < 100ms)", response_time_ms)
         
-        return PlainTextResponse(content=validation_token, status_code=200)
+        return validation_response(validation_token)
     
     # Parse notification body
     notification, error_response = await parse_notification_body(request)
@@ -699,31 +890,48 @@ async def webhook_notification(request: Request):
     if notification.validationTokens:
         logger.debug("Validation tokens in notification (already validated)")
     
+    # Verify each distinct client state once (Graph batches share one subscription's state)
+    verified_states = {
+        state: verify_webhook_client_state(state)
+        for state in {change.clientState for change in notification.value}
+        if state
+    }
+    
     # Process each change notification
     for change in notification.value:
+        # Verify client state
+        if change.clientState and not verified_states[change.clientState]:
+            logger.warning(f"Invalid client state in notification: {change.clientState}")
+            continue
+        
+        # Filter out non-message changes before doing any real work (handles both resource formats)
+        resource = change.resource
+        if "/messages" not in resource and "messages(" not in resource:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Ignoring non-message resource: %s", resource)
+            continue
+        
+        if change.changeType not in _MESSAGE_CHANGE_TYPES:
+            logger.info(f"Ignoring change type: {change.changeType} for resource: {resource}")
+            continue
+        
+        # Collapse bursts of notifications for the same message into one processing run.
+        # Anything missed here is still caught by the reaction polling queue.
+        resource_info = extract_team_channel_from_resource(resource)
+        if resource_info and resource_info in _recently_scheduled:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Skipping duplicate notification for message %s", resource_info[2])
+            continue
+        
         try:
-            # Verify client state
-            if change.clientState and not verify_webhook_client_state(change.clientState):
-                logger.warning(f"Invalid client state in notification: {change.clientState}")
-                continue
-            
-            # Log the change type and resource for debugging
-            logger.info(f"Processing change notification: changeType={change.changeType}, resource={change.resource}")
-            
-            # Check if this is a message-related change (handles both formats)
-            if "/messages" in change.resource or "messages(" in change.resource:
-                if change.changeType in ["created", "updated"]:
-                    logger.info(f"Message {change.changeType} detected - processing for reactions...")
-                    # Process message reaction
-                    await process_message_reaction(change)
-                else:
-                    logger.info(f"Ignoring change type: {change.changeType} for resource: {change.resource}")
-            else:
-                logger.debug(f"Ignoring non-message resource: {change.resource}")
-                
+            logger.info(f"Message {change.changeType} detected - scheduling reaction processing...")
+            # Queue for the worker pool so Graph gets its 202 without waiting on Graph/Notion calls
+            # Only debounce once queued, so a dropped notification doesn't suppress the next one
+            if schedule_reaction_processing(change) and resource_info:
+                _recently_scheduled[resource_info] = True
         except Exception as e:
             logger.error(f"Error processing change notification: {str(e)}", exc_info=True)
             # Continue processing other notifications even if one fails
     
-    # Return 202 Accepted to acknowledge receipt
-    return PlainTextResponse("OK", status_code=202)
+    # Return 202 Accepted to acknowledge receipt (processing continues in the background)
+    return _OK_202
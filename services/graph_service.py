@@ -1,13 +1,23 @@
 """Microsoft Graph API service for Teams integration."""
+import asyncio
 import logging
+import os
+import threading
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, NoReturn, Tuple, Union
 from datetime import datetime, timedelta, timezone
 import httpx
-from msal import ConfidentialClientApplication
+import orjson
+import requests
+from cachetools import TTLCache
+from msal import ConfidentialClientApplication, SerializableTokenCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import settings
 from models.webhook_models import GraphMessage
-from utils.graph_subscriptions import normalize_graph_subscription
+from utils.graph_subscriptions import format_graph_datetime, normalize_graph_subscription
+from utils.http_transport import build_async_transport
+from utils.subscription_tracking import track_subscription_creation
 
 logger = logging.getLogger(__name__)
 
@@ -15,74 +25,425 @@ logger = logging.getLogger(__name__)
 GRAPH_API_BASE = "https://graph.microsoft.com/v1.0"
 GRAPH_AUTHORITY = f"https://login.microsoftonline.com/{settings.microsoft_tenant_id}"
 
-# Connection pool settings for better performance
-CONNECTION_LIMIT = 10
-TIMEOUT = 30.0
+# Maximum number of sub-requests Graph accepts in one $batch call
+GRAPH_BATCH_LIMIT = 20
+
+# Message fields needed for ticket creation (reactions are included by default, not expandable)
+MESSAGE_SELECT = "id,messageType,createdDateTime,lastModifiedDateTime,subject,body,from,reactions,attachments,channelIdentity"
+
+# User and channel metadata is near-static, so lookups are cached
+# (users for 10 minutes so profile/email changes show up reasonably fast, channels for an hour)
+LOOKUP_CACHE_SIZE = 10_000
+USER_CACHE_TTL = 600
+CHANNEL_CACHE_TTL = 3600
+
+# Connection pool sizing comes from settings (graph_connection_limit etc.)
+# With HTTP/2, concurrent requests are multiplexed over a single TLS connection
+
+# Throttling/transient-error retries (Retry-After is honored when Graph sends it)
+GRAPH_MAX_RETRIES = 3
+GRAPH_RETRY_BASE_DELAY = 1.0
+GRAPH_RETRY_MAX_DELAY = 30.0
+# 429 means the request was not processed, so it is safe to retry for any method;
+# 503/504 are only retried for idempotent methods
+THROTTLED_STATUS = 429
+TRANSIENT_STATUSES = frozenset({503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "DELETE"})
+
+# Refresh the bearer token this many seconds before it expires (MSAL tokens live ~60-90 minutes)
+TOKEN_REFRESH_BUFFER = 60
+
+# Stage-wise timeouts: fail fast on connect/pool waits, allow slow reads
+# (subscription creation blocks until Graph has validated the webhook)
+TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+
+
+class GraphAPIError(Exception):
+    """Graph API request failed with an HTTP error status."""
+    
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class GraphUnauthorized(GraphAPIError):
+    """401 - the bearer token was rejected."""
+
+
+class GraphRateLimited(GraphAPIError):
+    """429 - Graph throttled the request."""
+    
+    def __init__(self, message: str, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(message, status_code)
+        self.retry_after = retry_after
+
+
+class GraphServerError(GraphAPIError):
+    """5xx - transient or server-side failure."""
+
+
+class GraphValidationTimeout(GraphAPIError):
+    """Subscription creation failed because Graph's webhook validation request timed out."""
+
+
+class GraphClientError(GraphAPIError):
+    """Other 4xx - the request itself is wrong; retrying won't help."""
+
+
+def _build_msal_session() -> requests.Session:
+    """
+    Build the pooled, retrying HTTP session MSAL uses for token requests.
+    
+    Keeps the TLS connection to login.microsoftonline.com alive across refreshes.
+    Token requests are POSTs but safe to repeat, so retries cover all methods.
+    
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=None
+        )
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by every GraphService instance so all token refreshes reuse one pool
+_msal_session = _build_msal_session()
+
+
+def _load_msal_token_cache() -> SerializableTokenCache:
+    """
+    Build the MSAL token cache, rehydrated from disk when a cache path is configured.
+    
+    Lets restarts reuse a still-valid token instead of a round-trip to login.microsoftonline.com.
+    
+    Returns:
+        Token cache (empty if there is no readable cache file)
+    """
+    token_cache = SerializableTokenCache()
+    path = settings.graph_token_cache_path
+    if path and os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                token_cache.deserialize(f.read())
+        except Exception as e:
+            logger.warning(f"Could not load MSAL token cache from {path}: {str(e)}")
+    return token_cache
+
+
+# Process-wide, so additional GraphService instances are served from MSAL's cache
+# instead of each fetching their own token
+_msal_token_cache = _load_msal_token_cache()
+
+
+def build_graph_http_client() -> httpx.AsyncClient:
+    """
+    Build the pooled async client used for Graph requests.
+    
+    Reuses connections and lets independent Graph calls overlap on the event loop.
+    base_url and the static Content-Type header are applied by the client on every request.
+    
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    return httpx.AsyncClient(
+        base_url=GRAPH_API_BASE,
+        headers={"Content-Type": "application/json"},
+        transport=build_async_transport(
+            httpx.Limits(
+                max_connections=settings.graph_connection_limit,
+                max_keepalive_connections=settings.graph_keepalive_limit,
+                keepalive_expiry=settings.graph_keepalive_seconds
+            )
+        ),
+        timeout=TIMEOUT
+    )
+
+
+def _parse_graph_error(response: httpx.Response) -> Tuple[str, str, Optional[str], bool]:
+    """
+    Extract the error details from a failed Graph response.
+    
+    Args:
+        response: Graph response with an error status
+        
+    Returns:
+        Tuple of (error message, error code, request-id, is validation timeout); the
+        message falls back to the raw body and the code to "Unknown" if the body is not
+        a Graph error object
+    """
+    error_detail = response.text
+    try:
+        error = orjson.loads(response.content)["error"]
+        error_detail = error.get("message") or error_detail
+        error_code = error.get("code") or "Unknown"
+        request_id = (error.get("innerError") or {}).get("request-id")
+    except (ValueError, KeyError, TypeError, AttributeError):
+        # Not JSON (orjson.JSONDecodeError is a ValueError) or not the expected shape
+        return error_detail, "Unknown", None, False
+    
+    is_validation_timeout = (
+        error_code == "ValidationError" and "timeout" in error_detail.lower()
+    ) or "Subscription validation request timed out" in error_detail
+    return error_detail, error_code, request_id, is_validation_timeout
 
 
 class GraphService:
-    """Service for interacting with Microsoft Graph API."""
+    """
+    Service for interacting with Microsoft Graph API.
     
-    def __init__(self):
-        """Initialize the Graph service with MSAL app and connection pooling."""
+    Uses __slots__ for compact instances and fast attribute access on the request
+    path; subclasses must declare __slots__ for any attributes they add.
+    """
+    
+    __slots__ = (
+        "app",
+        "_token_cache",
+        "_token_cache_path",
+        "_access_token",
+        "_token_expires_at",
+        "_token_refresh_at",
+        "_auth_header",
+        "_token_lock",
+        "_last_subscription_resource",
+        "_last_subscription_creation_time",
+        "_http_client",
+        "_owns_http_client",
+        "_http_version_logged",
+        "_request_semaphore",
+        "_user_cache",
+        "_channel_cache",
+        "_lookup_cache_lock",
+        "_inflight_lookups",
+    )
+    
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the Graph service with MSAL app and connection pooling.
+        
+        Args:
+            http_client: Pre-configured client (see build_graph_http_client). When
+                given, the caller owns it and aclose() leaves it open.
+        """
+        # Process-wide MSAL token cache (persisted to the configured path on change)
+        self._token_cache = _msal_token_cache
+        self._token_cache_path = settings.graph_token_cache_path
+        
         self.app = ConfidentialClientApplication(
             client_id=settings.microsoft_client_id,
             client_credential=settings.microsoft_client_secret,
-            authority=GRAPH_AUTHORITY
+            authority=GRAPH_AUTHORITY,
+            token_cache=self._token_cache,
+            http_client=_msal_session
         )
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
+        # time.monotonic() deadline after which the token is refreshed (cheap hot-path check)
+        self._token_refresh_at = 0.0
+        # Authorization header, rebuilt (and byte-encoded) only when the token rotates
+        self._auth_header = httpx.Headers()
         
-        # Create persistent httpx client with connection pooling
-        # This reuses connections and reduces TCP handshake overhead
-        self._http_client = httpx.Client(
-            limits=httpx.Limits(
-                max_connections=CONNECTION_LIMIT,
-                max_keepalive_connections=CONNECTION_LIMIT,
-                keepalive_expiry=300.0
-            ),
-            timeout=TIMEOUT
-        )
+        # Most recent subscription creation, for validation latency tracking
+        self._last_subscription_resource: Optional[str] = None
+        self._last_subscription_creation_time: Optional[float] = None
+        # Serializes refreshes so concurrent requests don't each hit the token endpoint
+        self._token_lock = asyncio.Lock()
+        
+        # Persistent async client with connection pooling (injected or owned by this service)
+        self._owns_http_client = http_client is None
+        self._http_client = http_client or build_graph_http_client()
+        self._http_version_logged = False
+        # Bounds concurrent Graph calls (held only for the HTTP exchange, not retry backoff)
+        self._request_semaphore = asyncio.Semaphore(settings.graph_max_concurrency)
         
-        logger.info(f"GraphService initialized with connection pooling (max={CONNECTION_LIMIT})")
+        # TTL caches for user/channel lookups, keyed by Graph path
+        self._user_cache: TTLCache = TTLCache(maxsize=LOOKUP_CACHE_SIZE, ttl=USER_CACHE_TTL)
+        self._channel_cache: TTLCache = TTLCache(maxsize=LOOKUP_CACHE_SIZE, ttl=CHANNEL_CACHE_TTL)
+        self._lookup_cache_lock = threading.Lock()
+        
+        # Single-flight: lookups currently being fetched, so concurrent callers share one request
+        # (event-loop confined, resolved with the result or the Exception as a value)
+        self._inflight_lookups: Dict[str, asyncio.Future] = {}
+        
+        logger.info(
+            f"GraphService initialized with connection pooling "
+            f"(max={settings.graph_connection_limit}, keepalive={settings.graph_keepalive_limit}, "
+            f"keepalive_expiry={settings.graph_keepalive_seconds}s, "
+            f"max_concurrency={settings.graph_max_concurrency})"
+        )
     
-    def __del__(self):
-        """Cleanup httpx client on destruction."""
-        if hasattr(self, '_http_client'):
-            self._http_client.close()
+    async def aclose(self) -> None:
+        """Close the httpx client if this service owns it (must be awaited from the event loop)."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
             logger.debug("GraphService httpx client closed")
     
-    def _get_access_token(self) -> str:
+    async def _get_access_token(self) -> str:
         """
         Get a valid access token, refreshing if necessary.
         
+        MSAL's token request is blocking, so it runs on the default executor.
+        
         Returns:
             Access token string
             
         Raises:
             Exception: If token acquisition fails
         """
-        # Check if we have a valid token
-        if self._access_token and self._token_expires_at:
-            if datetime.now(timezone.utc) < self._token_expires_at - timedelta(minutes=5):
+        # Lock-free fast path for the common case of a still-valid token
+        if self._has_valid_token():
+            return self._access_token
+        
+        async with self._token_lock:
+            # Another request may have refreshed the token while we waited
+            if self._has_valid_token():
                 return self._access_token
+            
+            # Acquire new token (MSAL serves it from its cache while still valid)
+            result = await asyncio.to_thread(self._acquire_token)
+            
+            if "access_token" not in result:
+                error = result.get("error_description", "Unknown error")
+                raise Exception(f"Failed to acquire access token: {error}")
+            
+            self._access_token = result["access_token"]
+            # Pre-encoded so httpx doesn't re-encode the long bearer string on every request
+            self._auth_header = httpx.Headers([(b"Authorization", b"Bearer " + self._access_token.encode("ascii"))])
+            expires_in = result.get("expires_in", 3600)
+            self._token_expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+            self._token_refresh_at = time.monotonic() + expires_in - TOKEN_REFRESH_BUFFER
+        
+        return self._access_token
+    
+    def _invalidate_token(self) -> None:
+        """Drop the held token and MSAL's cached copies so the next request fetches a new one."""
+        self._access_token = None
+        self._token_expires_at = None
+        self._token_refresh_at = 0.0
+        for access_token in self._token_cache.find(SerializableTokenCache.CredentialType.ACCESS_TOKEN):
+            self._token_cache.remove_at(access_token)
+    
+    def _has_valid_token(self) -> bool:
+        """Check whether the held token is valid for longer than TOKEN_REFRESH_BUFFER."""
+        return self._access_token is not None and time.monotonic() < self._token_refresh_at
+    
+    def _acquire_token(self) -> Dict[str, Any]:
+        """
+        Acquire a token from MSAL and persist the token cache if it changed.
         
-        # Acquire new token
+        Blocking - called via asyncio.to_thread.
+        
+        Returns:
+            MSAL token response
+        """
         result = self.app.acquire_token_for_client(
             scopes=["https://graph.microsoft.com/.default"]
         )
         
-        if "access_token" not in result:
-            error = result.get("error_description", "Unknown error")
-            raise Exception(f"Failed to acquire access token: {error}")
+        if self._token_cache_path and self._token_cache.has_state_changed:
+            try:
+                # Cache holds bearer tokens - keep it readable by the service user only
+                fd = os.open(self._token_cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(self._token_cache.serialize())
+                self._token_cache.has_state_changed = False
+            except Exception as e:
+                logger.warning(f"Could not persist MSAL token cache to {self._token_cache_path}: {str(e)}")
         
-        self._access_token = result["access_token"]
-        expires_in = result.get("expires_in", 3600)
-        self._token_expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+        return result
+    
+    async def _build_headers(self) -> httpx.Headers:
+        """
+        Get the per-request headers (the bearer token), refreshing the token if needed.
         
-        return self._access_token
+        Content-Type and the base URL are set on the client itself.
+        
+        Returns:
+            Authorization header for Graph API requests
+        """
+        await self._get_access_token()
+        return self._auth_header
     
-    def _make_request(
+    def _log_request_data(self, method: str, url: str, data: Optional[Dict[str, Any]]) -> None:
+        """Log request details for debugging (excluding sensitive data)."""
+        # Skip building the scrubbed copy entirely unless DEBUG logging is on
+        if data and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Graph API request: %s %s with data: %s",
+                method, url, {k: v for k, v in data.items() if k != "clientState"}
+            )
+    
+    def _raise_for_graph_error(self, e: httpx.HTTPStatusError, method: str, url: str) -> NoReturn:
+        """
+        Log a failed Graph API response and raise a descriptive exception.
+        
+        Args:
+            e: HTTP status error raised by httpx
+            method: HTTP method of the failed request
+            url: Full URL of the failed request
+            
+        Raises:
+            GraphAPIError: Always - the subclass matching the failure, with the Graph error message
+        """
+        error_detail, error_code, request_id, is_validation_timeout = _parse_graph_error(e.response)
+        
+        if error_code != "Unknown":
+            # Log full error response for debugging
+            logger.error(f"Graph API full error response: {e.response.text}")
+            logger.error(f"Graph API error code: {error_code}")
+            if request_id:
+                logger.error(f"Graph API request-id: {request_id}")
+        
+        # Special logging for validation timeout
+        if is_validation_timeout:
+            logger.error(
+                "VALIDATION TIMEOUT DETECTED: Microsoft Graph validation request timed out. "
+                "This usually indicates the service was cold or network latency delayed the validation request. "
+                "The webhook endpoint may have responded correctly, but too late for Microsoft Graph's timeout window."
+            )
+            # Store request-id for latency tracking (will be matched when validation arrives)
+            if request_id and self._last_subscription_resource:
+                track_subscription_creation(
+                    request_id,
+                    self._last_subscription_resource,
+                    created_at=self._last_subscription_creation_time
+                )
+        
+        logger.error(f"Graph API request failed: {e.response.status_code} - {error_detail}")
+        logger.error(f"Request URL: {url}")
+        logger.error(f"Request method: {method}")
+        
+        status_code = e.response.status_code
+        
+        # Preserve validation timeout information in exception message
+        if is_validation_timeout:
+            raise GraphValidationTimeout(
+                f"Graph API error {status_code}: Subscription validation request timed out.", status_code
+            )
+        
+        message = f"Graph API error {status_code}: {error_detail}"
+        if status_code == 401:
+            raise GraphUnauthorized(message, status_code)
+        if status_code == THROTTLED_STATUS:
+            retry_after = e.response.headers.get("Retry-After")
+            try:
+                retry_after = float(retry_after) if retry_after else None
+            except ValueError:
+                retry_after = None
+            raise GraphRateLimited(message, status_code, retry_after=retry_after)
+        if status_code >= 500:
+            raise GraphServerError(message, status_code)
+        raise GraphClientError(message, status_code)
+    
+    async def _make_request(
         self,
         method: str,
         endpoint: str,
@@ -92,8 +453,6 @@ class GraphService:
         """
         Make an authenticated request to Microsoft Graph API.
         
-        Uses persistent httpx client with connection pooling for better performance.
-        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (relative to base URL)
@@ -101,91 +460,178 @@ class GraphService:
             params: Query parameters
             
         Returns:
-            Response JSON data
+            Response JSON data (empty dict for bodiless responses such as DELETE)
             
         Raises:
             Exception: If request fails
         """
-        token = self._get_access_token()
-        url = f"{GRAPH_API_BASE}/{endpoint.lstrip('/')}"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
+        raw = await self._make_request_bytes(method, endpoint, data=data, params=params)
+        if not raw:
+            return {}
+        return orjson.loads(raw)
+    
+    async def _make_request_bytes(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Make an authenticated request to Microsoft Graph API and return the raw body.
         
-        try:
-            # Log request details for debugging (excluding sensitive data)
-            if data:
-                log_data = {k: v for k, v in data.items() if k != "clientState"}
-                logger.debug(f"Graph API request: {method} {url} with data: {log_data}")
+        Uses persistent httpx.AsyncClient with connection pooling so independent
+        Graph calls can run concurrently. Callers that feed a Pydantic model parse
+        these bytes directly instead of going through an intermediate dict.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (relative to base URL)
+            data: Request body data
+            params: Query parameters
             
-            # Use persistent client with connection pooling
-            response = self._http_client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=data,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text
-            error_code = "Unknown"
-            is_validation_timeout = False
+        Returns:
+            Undecoded response body
             
-            try:
-                error_json = e.response.json()
-                error_detail = error_json.get("error", {}).get("message", error_detail)
-                error_code = error_json.get("error", {}).get("code", "Unknown")
-                
-                # Extract request-id for latency tracking
-                request_id = error_json.get("error", {}).get("innerError", {}).get("request-id")
+        Raises:
+            GraphAPIError: If Graph returns an error status (after retries)
+            Exception: If the request fails otherwise
+        """
+        path = endpoint.lstrip('/')
+        headers = await self._build_headers()
+        token_refreshed = False
+        
+        try:
+            self._log_request_data(method, path, data)
+            content = orjson.dumps(data) if data is not None else None
+            
+            attempt = 0
+            while True:
+                # Use persistent client with connection pooling
+                # orjson handles body encode/decode (faster than httpx's stdlib json)
+                async with self._request_semaphore:
+                    response = await self._http_client.request(
+                        method=method,
+                        url=path,
+                        headers=headers,
+                        content=content,
+                        params=params
+                    )
                 
-                # Check if this is a validation timeout error
-                is_validation_timeout = (
-                    error_code == "ValidationError" and 
-                    "timeout" in error_detail.lower()
-                ) or "Subscription validation request timed out" in error_detail
+                # Token rejected (e.g. revoked or expired early) - refresh once and retry without sleeping
+                if response.status_code == 401 and not token_refreshed:
+                    token_refreshed = True
+                    logger.warning("Graph API %s %s returned 401, refreshing token and retrying", method, path)
+                    self._invalidate_token()
+                    headers = await self._build_headers()
+                    continue
                 
-                # Log full error response for debugging
-                logger.error(f"Graph API full error response: {error_json}")
-                logger.error(f"Graph API error code: {error_code}")
-                if request_id:
-                    logger.error(f"Graph API request-id: {request_id}")
+                if attempt == GRAPH_MAX_RETRIES or not self._is_retryable(method, response.status_code):
+                    break
                 
-                # Special logging for validation timeout
-                if is_validation_timeout:
-                    logger.error(
-                        "VALIDATION TIMEOUT DETECTED: Microsoft Graph validation request timed out. "
-                        "This usually indicates the service was cold or network latency delayed the validation request. "
-                        "The webhook endpoint may have responded correctly, but too late for Microsoft Graph's timeout window."
-                    )
-                    # Store request-id for latency tracking (will be matched when validation arrives)
-                    if request_id and hasattr(self, '_last_subscription_resource'):
-                        from routes.webhooks import _subscription_creation_times
-                        import time
-                        _subscription_creation_times[request_id] = (
-                            time.time(),
-                            getattr(self, '_last_subscription_resource', 'unknown')
-                        )
-            except:
-                pass
+                # asyncio.sleep keeps the event loop serving webhooks during backoff
+                delay = self._retry_delay(response, attempt)
+                attempt += 1
+                logger.warning(
+                    "Graph API %s %s returned %d, retrying in %.1fs (attempt %d/%d)",
+                    method, path, response.status_code, delay, attempt, GRAPH_MAX_RETRIES
+                )
+                await asyncio.sleep(delay)
             
-            logger.error(f"Graph API request failed: {e.response.status_code} - {error_detail}")
-            logger.error(f"Request URL: {url}")
-            logger.error(f"Request method: {method}")
+            if not self._http_version_logged:
+                self._http_version_logged = True
+                logger.debug("Graph API negotiated %s", response.http_version)
+            response.raise_for_status()
+            return response.content
+        except httpx.HTTPStatusError as e:
+            self._raise_for_graph_error(e, method, str(e.request.url))
+        except Exception as e:
+            logger.error("Graph API request error: %s", e)
+            raise
+    
+    @staticmethod
+    def _is_retryable(method: str, status_code: int) -> bool:
+        """Check whether a Graph response status warrants a retry for this method."""
+        if status_code == THROTTLED_STATUS:
+            return True
+        return status_code in TRANSIENT_STATUSES and method.upper() in IDEMPOTENT_METHODS
+    
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """
+        Work out how long to wait before retrying a throttled/failed Graph request.
+        
+        Args:
+            response: The retryable response
+            attempt: Zero-based attempt number that produced the response
             
-            # Preserve validation timeout information in exception message
-            if is_validation_timeout:
-                raise Exception(f"Graph API error {e.response.status_code}: Subscription validation request timed out.")
-            else:
-                raise Exception(f"Graph API error {e.response.status_code}: {error_detail}")
+        Returns:
+            Delay in seconds - Graph's Retry-After if present, else exponential backoff
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), GRAPH_RETRY_MAX_DELAY)
+            except ValueError:
+                pass
+        return min(GRAPH_RETRY_BASE_DELAY * (2 ** attempt), GRAPH_RETRY_MAX_DELAY)
+    
+    def _lookup_cache_for(self, path: str) -> TTLCache:
+        """Pick the user or channel cache for a Graph path."""
+        return self._user_cache if path.startswith("/users/") else self._channel_cache
+    
+    def _lookup_cache_get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Return a cached user/channel lookup, or None on a miss."""
+        with self._lookup_cache_lock:
+            return self._lookup_cache_for(path).get(path)
+    
+    def _lookup_cache_set(self, path: str, data: Dict[str, Any]) -> None:
+        """Store a user/channel lookup result."""
+        with self._lookup_cache_lock:
+            self._lookup_cache_for(path)[path] = data
+    
+    def _begin_lookup(self, path: str) -> asyncio.Future:
+        """Register this caller as the one fetching a path; others wait on the returned future."""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_lookups[path] = future
+        return future
+    
+    def _end_lookup(self, path: str, future: asyncio.Future, result: Union[Dict[str, Any], Exception]) -> None:
+        """Cache a successful lookup and hand the result to any waiting callers."""
+        if not isinstance(result, Exception):
+            self._lookup_cache_set(path, result)
+        if self._inflight_lookups.get(path) is future:
+            del self._inflight_lookups[path]
+        if not future.done():
+            future.set_result(result)
+    
+    async def _cached_get(self, endpoint: str) -> Dict[str, Any]:
+        """GET a user/channel endpoint through the lookup cache, coalescing concurrent misses."""
+        data = self._lookup_cache_get(endpoint)
+        if data is not None:
+            return data
+        
+        pending = self._inflight_lookups.get(endpoint)
+        if pending is not None:
+            # Shield so a cancelled waiter doesn't cancel the shared lookup
+            result = await asyncio.shield(pending)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        
+        future = self._begin_lookup(endpoint)
+        try:
+            data = await self._make_request("GET", endpoint)
         except Exception as e:
-            logger.error(f"Graph API request error: {str(e)}")
+            self._end_lookup(endpoint, future, e)
             raise
+        except BaseException:
+            self._end_lookup(endpoint, future, Exception(f"Graph lookup for {endpoint} was cancelled"))
+            raise
+        self._end_lookup(endpoint, future, data)
+        return data
     
-    def create_subscription(
+    async def create_subscription(
         self,
         resource: str,
         change_types: List[str],
@@ -221,30 +667,30 @@ class GraphService:
         
         # Store resource for latency tracking
         self._last_subscription_resource = resource
-        self._last_subscription_creation_time = time.time()
+        self._last_subscription_creation_time = time.monotonic()
         
         # Log the subscription payload for debugging
         logger.info(f"Creating subscription with payload: {subscription_data}")
         
         try:
-            result = self._make_request("POST", "/subscriptions", data=subscription_data)
+            result = await self._make_request("POST", "/subscriptions", data=subscription_data)
             # If successful, we can't track latency (no request-id in success response)
             return result
         except Exception as e:
             # Error handling in _make_request will store request-id if available
             raise
     
-    def list_subscriptions(self) -> List[Dict[str, Any]]:
+    async def list_subscriptions(self) -> List[Dict[str, Any]]:
         """
         List all active subscriptions.
         
         Returns:
             List of subscription data
         """
-        response = self._make_request("GET", "/subscriptions")
+        response = await self._make_request("GET", "/subscriptions")
         return response.get("value", [])
     
-    def renew_subscription(self, subscription_id: str, expiration_datetime: Optional[datetime] = None) -> Dict[str, Any]:
+    async def renew_subscription(self, subscription_id: str, expiration_datetime: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Renew a subscription by updating its expiration.
         
@@ -255,32 +701,65 @@ class GraphService:
         Returns:
             Updated subscription data
         """
-        if expiration_datetime is None:
-            expiration_datetime = datetime.now(timezone.utc) + timedelta(days=3)
+        update_data = {
+            "expirationDateTime": self._format_expiration(expiration_datetime)
+        }
         
-        # Format datetime for Microsoft Graph (must end with Z, not +00:00)
-        expiration_str = expiration_datetime.isoformat()
-        if expiration_str.endswith('+00:00'):
-            expiration_str = expiration_str.replace('+00:00', 'Z')
-        elif not expiration_str.endswith('Z'):
-            expiration_str = expiration_str + 'Z'
+        return await self._make_request("PATCH", f"/subscriptions/{subscription_id}", data=update_data)
+    
+    async def renew_subscriptions(
+        self,
+        subscription_ids: List[str],
+        expiration_datetime: Optional[datetime] = None
+    ) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """
+        Renew several subscriptions through the Graph $batch endpoint.
         
+        Args:
+            subscription_ids: IDs of the subscriptions to renew
+            expiration_datetime: New expiration (default: 3 days from now)
+            
+        Returns:
+            Mapping of subscription ID to the updated subscription data, or to an
+            Exception if that renewal failed
+        """
         update_data = {
-            "expirationDateTime": expiration_str
+            "expirationDateTime": self._format_expiration(expiration_datetime)
         }
+        return await self.batch({
+            subscription_id: {
+                "method": "PATCH",
+                "url": f"/subscriptions/{subscription_id}",
+                "body": update_data,
+            }
+            for subscription_id in subscription_ids
+        })
+    
+    @staticmethod
+    def _format_expiration(expiration_datetime: Optional[datetime]) -> str:
+        """
+        Format a subscription expiration for Microsoft Graph.
         
-        return self._make_request("PATCH", f"/subscriptions/{subscription_id}", data=update_data)
+        Args:
+            expiration_datetime: Expiration to format (default: 3 days from now)
+            
+        Returns:
+            ISO 8601 string ending in Z
+        """
+        if expiration_datetime is None:
+            expiration_datetime = datetime.now(timezone.utc) + timedelta(days=3)
+        return format_graph_datetime(expiration_datetime)
     
-    def delete_subscription(self, subscription_id: str) -> None:
+    async def delete_subscription(self, subscription_id: str) -> None:
         """
         Delete a subscription.
         
         Args:
             subscription_id: ID of the subscription to delete
         """
-        self._make_request("DELETE", f"/subscriptions/{subscription_id}")
+        await self._make_request("DELETE", f"/subscriptions/{subscription_id}")
     
-    def get_message(self, team_id: str, channel_id: str, message_id: str) -> GraphMessage:
+    async def get_message(self, team_id: str, channel_id: str, message_id: str) -> GraphMessage:
         """
         Get a Teams channel message with full details including reactions.
         
@@ -299,13 +778,44 @@ class GraphService:
         # Select fields including reactions (reactions cannot be expanded, but are included by default)
         # Explicitly select fields we need to ensure reactions are included
         params = {
-            "$select": "id,messageType,createdDateTime,lastModifiedDateTime,subject,body,from,reactions,attachments,channelIdentity"
+            "$select": MESSAGE_SELECT
         }
         
-        data = self._make_request("GET", endpoint, params=params)
-        return GraphMessage(**data)
+        raw = await self._make_request_bytes("GET", endpoint, params=params)
+        return GraphMessage.parse_raw(raw)
     
-    def get_channel_info(self, team_id: str, channel_id: str) -> Dict[str, Any]:
+    async def get_messages_bulk(
+        self,
+        refs: List[Tuple[str, str, str]]
+    ) -> Dict[Tuple[str, str, str], Union[GraphMessage, Exception]]:
+        """
+        Get several Teams channel messages through the Graph $batch endpoint.
+        
+        Args:
+            refs: (team_id, channel_id, message_id) tuples
+            
+        Returns:
+            Mapping of each ref to its message, or to an Exception if that fetch failed
+        """
+        paths = {
+            str(i): f"/teams/{team_id}/channels/{channel_id}/messages/{message_id}?$select={MESSAGE_SELECT}"
+            for i, (team_id, channel_id, message_id) in enumerate(refs)
+        }
+        responses = await self.batch_get(paths)
+        
+        messages: Dict[Tuple[str, str, str], Union[GraphMessage, Exception]] = {}
+        for i, ref in enumerate(refs):
+            result = responses[str(i)]
+            if isinstance(result, Exception):
+                messages[ref] = result
+                continue
+            try:
+                messages[ref] = GraphMessage(**result)
+            except Exception as e:
+                messages[ref] = e
+        return messages
+    
+    async def get_channel_info(self, team_id: str, channel_id: str) -> Dict[str, Any]:
         """
         Get channel information.
         
@@ -317,9 +827,9 @@ class GraphService:
             Channel data
         """
         endpoint = f"/teams/{team_id}/channels/{channel_id}"
-        return self._make_request("GET", endpoint)
+        return await self._cached_get(endpoint)
     
-    def get_user_info(self, user_id: str) -> Dict[str, Any]:
+    async def get_user_info(self, user_id: str) -> Dict[str, Any]:
         """
         Get user information.
         
@@ -330,4 +840,119 @@ class GraphService:
             User data
         """
         endpoint = f"/users/{user_id}"
-        return self._make_request("GET", endpoint)
+        return await self._cached_get(endpoint)
+    
+    async def batch(
+        self,
+        requests: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """
+        Send sub-requests through the Graph $batch endpoint.
+        
+        Collapses N round-trips into one per GRAPH_BATCH_LIMIT sub-requests; when more
+        than one $batch call is needed they are issued concurrently.
+        
+        Args:
+            requests: Mapping of caller-chosen request ID to a sub-request dict with
+                "method", "url" (relative to the API base), and optional "body"
+            
+        Returns:
+            Mapping of request ID to the response body, or to an Exception if that
+            sub-request (or its whole batch) failed
+        """
+        items = list(requests.items())
+        chunks = [items[start:start + GRAPH_BATCH_LIMIT] for start in range(0, len(items), GRAPH_BATCH_LIMIT)]
+        results: Dict[str, Union[Dict[str, Any], Exception]] = {}
+        for chunk_results in await asyncio.gather(*(self._send_batch(chunk) for chunk in chunks)):
+            results.update(chunk_results)
+        return results
+    
+    async def _send_batch(
+        self,
+        chunk: List[Tuple[str, Dict[str, Any]]]
+    ) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """Send one $batch call of at most GRAPH_BATCH_LIMIT sub-requests."""
+        sub_requests = []
+        for request_id, request in chunk:
+            sub_request = {"id": request_id, "method": request["method"], "url": request["url"]}
+            if request.get("body") is not None:
+                sub_request["body"] = request["body"]
+                sub_request["headers"] = {"Content-Type": "application/json"}
+            sub_requests.append(sub_request)
+        
+        results: Dict[str, Union[Dict[str, Any], Exception]] = {}
+        try:
+            response = await self._make_request("POST", "/$batch", data={"requests": sub_requests})
+        except Exception as e:
+            return {request_id: e for request_id, _ in chunk}
+        
+        for item in response.get("responses", []):
+            request_id = item.get("id")
+            status = item.get("status", 500)
+            body = item.get("body") or {}
+            if status >= 400:
+                error_detail = body.get("error", {}).get("message", "Unknown error")
+                results[request_id] = Exception(f"Graph API error {status}: {error_detail}")
+            else:
+                results[request_id] = body
+        
+        # Graph should answer every sub-request, but never leave a caller without a result
+        for request_id, _ in chunk:
+            results.setdefault(request_id, Exception("Graph API error: missing $batch response"))
+        
+        return results
+    
+    async def batch_get(
+        self,
+        paths: Dict[str, str],
+        cached: bool = False
+    ) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """
+        Issue several independent GET requests through the Graph $batch endpoint.
+        
+        Args:
+            paths: Mapping of caller-chosen request ID to Graph path (e.g. "/users/{id}")
+            cached: If True, serve paths from the lookup cache and only batch the misses
+            
+        Returns:
+            Mapping of request ID to the response body, or to an Exception if that
+            sub-request (or the whole batch) failed
+        """
+        results: Dict[str, Union[Dict[str, Any], Exception]] = {}
+        misses: Dict[str, Dict[str, Any]] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        owned: Dict[str, asyncio.Future] = {}
+        
+        for request_id, path in paths.items():
+            if cached:
+                hit = self._lookup_cache_get(path)
+                if hit is not None:
+                    results[request_id] = hit
+                    continue
+                # Share lookups another caller is already fetching
+                pending = self._inflight_lookups.get(path)
+                if pending is not None:
+                    waiting[request_id] = pending
+                    continue
+                owned[request_id] = self._begin_lookup(path)
+            misses[request_id] = {"method": "GET", "url": path}
+        
+        fetched: Dict[str, Union[Dict[str, Any], Exception]] = {}
+        try:
+            fetched = await self.batch(misses)
+        finally:
+            # Resolve every lookup this call owns, even on failure or cancellation
+            for request_id, future in owned.items():
+                result = fetched.get(request_id)
+                if result is None:
+                    result = Exception(f"Graph lookup for {paths[request_id]} was cancelled")
+                self._end_lookup(paths[request_id], future, result)
+        results.update(fetched)
+        
+        for request_id, future in waiting.items():
+            results[request_id] = await asyncio.shield(future)
+        return results
+
+
+# Shared instance - every route and background task uses this one connection pool and token
+graph_service = GraphService()
@@ -1,54 +1,103 @@
 """Notion API service for ticket creation."""
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 import httpx
+import orjson
 from config import settings
+from utils.http_transport import build_async_transport
 
 logger = logging.getLogger(__name__)
 
 NOTION_API_BASE = "https://api.notion.com/v1"
+NOTION_API_VERSION = "2022-06-28"
 
 # Connection pool settings for better performance
-CONNECTION_LIMIT = 5
+# HTTP/2 multiplexes concurrent requests over one TLS connection, so a small pool suffices;
+# keep-alive covers the whole pool so the H2 socket is never evicted while idle
+CONNECTION_LIMIT = 4
+KEEPALIVE_EXPIRY = 120.0
 TIMEOUT = 30.0
 
+# Workspace users are loaded in one paginated pass and indexed by email;
+# the index is rebuilt on a miss once it is older than this (seconds)
+USER_INDEX_TTL = 3600
+USER_PAGE_SIZE = 100
+# Background refresh so newly added Notion users are picked up without a restart
+USER_INDEX_REFRESH_INTERVAL = 900
+
+# Teams message IDs known to have a ticket, so repeat reactions skip the duplicate query
+SEEN_MESSAGE_IDS_MAX = 10_000
+
+
+def build_notion_http_client() -> httpx.AsyncClient:
+    """
+    Build the pooled async client used for Notion requests.
+    
+    The Notion headers are static, so they and base_url are applied by the client
+    on every request instead of being passed per call.
+    
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    return httpx.AsyncClient(
+        base_url=NOTION_API_BASE,
+        headers={
+            "Authorization": f"Bearer {settings.notion_api_token}",
+            "Content-Type": "application/json",
+            "Notion-Version": NOTION_API_VERSION
+        },
+        transport=build_async_transport(
+            httpx.Limits(
+                max_connections=CONNECTION_LIMIT,
+                max_keepalive_connections=CONNECTION_LIMIT,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            )
+        ),
+        timeout=TIMEOUT
+    )
+
 
 class NotionService:
     """Service for interacting with Notion API."""
     
-    def __init__(self):
-        """Initialize the Notion service with connection pooling."""
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the Notion service with connection pooling.
+        
+        Args:
+            http_client: Pre-configured client (see build_notion_http_client). When
+                given, the caller owns it and aclose() leaves it open.
+        """
         self.database_id = settings.notion_database_id
         self.api_token = settings.notion_api_token
-        self.headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2022-06-28"
-        }
         
-        # Create persistent httpx client with connection pooling
-        # This reuses connections and reduces TCP handshake overhead
-        self._http_client = httpx.Client(
-            limits=httpx.Limits(
-                max_connections=CONNECTION_LIMIT,
-                max_keepalive_connections=CONNECTION_LIMIT,
-                keepalive_expiry=300.0
-            ),
-            timeout=TIMEOUT
-        )
+        # Persistent async httpx client with connection pooling (injected or owned by this service)
+        # This reuses connections and lets independent Notion calls overlap on the event loop
+        self._owns_http_client = http_client is None
+        self._http_client = http_client or build_notion_http_client()
+        self._http_version_logged = False
         
-        # Cache for Notion user IDs (email -> user_id mapping)
+        # Index of Notion person users (email -> user_id), built by _load_all_users
         self._user_id_cache: Dict[str, str] = {}
+        self._user_index_loaded_at: Optional[float] = None
+        self._user_index_lock = asyncio.Lock()
+        
+        # LRU of Teams message IDs with an existing ticket (oldest evicted first)
+        self._seen_message_ids: "OrderedDict[str, bool]" = OrderedDict()
         
         logger.info(f"NotionService initialized with connection pooling (max={CONNECTION_LIMIT})")
     
-    def _get_user_id_by_email(self, email: str) -> Optional[str]:
+    async def _get_user_id_by_email(self, email: str) -> Optional[str]:
         """
         Get Notion user ID by email address.
         
-        Lists Notion workspace users and finds matching email.
-        Results are cached for performance.
+        Served from the workspace user index, which is loaded on the first lookup and
+        reloaded on a miss once it is older than USER_INDEX_TTL. Emails with no Notion
+        user (e.g. external requesters) therefore don't trigger a re-scan every time.
         
         Args:
             email: User email address (case-insensitive)
@@ -59,39 +108,79 @@ class NotionService:
         email_lower = email.lower()
         
         # Check cache first
-        if email_lower in self._user_id_cache:
-            return self._user_id_cache[email_lower]
+        user_id = self._user_id_cache.get(email_lower)
+        if user_id:
+            return user_id
+        
+        if not self._user_index_fresh():
+            async with self._user_index_lock:
+                # Another request may have loaded the index while we waited
+                if not self._user_index_fresh():
+                    try:
+                        await self._load_all_users()
+                    except Exception as e:
+                        logger.warning(f"Could not get Notion user ID for {email}: {str(e)}")
+                        return None
+            user_id = self._user_id_cache.get(email_lower)
+            if user_id:
+                logger.debug(f"Found Notion user ID for {email}: {user_id}")
+                return user_id
         
+        logger.warning(f"Notion user not found for email: {email}")
+        return None
+    
+    async def warmup(self) -> None:
+        """Load the user index up front so the first ticket doesn't pay for it."""
         try:
-            # List all users in the workspace
-            response = self._make_request("GET", "/users")
-            users = response.get("results", [])
-            
-            # Search for user by email (case-insensitive)
-            for user in users:
-                user_email = None
-                if user.get("type") == "person":
-                    person = user.get("person", {})
-                    user_email = person.get("email", "").lower()
-                elif user.get("type") == "bot":
-                    # Skip bots
+            async with self._user_index_lock:
+                await self._load_all_users()
+        except Exception as e:
+            logger.warning(f"Notion user index warmup failed: {str(e)}")
+    
+    async def refresh_user_index_periodically(self) -> None:
+        """Background task that reloads the user index every USER_INDEX_REFRESH_INTERVAL seconds."""
+        while True:
+            await asyncio.sleep(USER_INDEX_REFRESH_INTERVAL)
+            await self.warmup()
+    
+    def _user_index_fresh(self) -> bool:
+        """Check whether the user index has been loaded within USER_INDEX_TTL."""
+        return (
+            self._user_index_loaded_at is not None
+            and time.monotonic() - self._user_index_loaded_at < USER_INDEX_TTL
+        )
+    
+    async def _load_all_users(self) -> None:
+        """
+        Page through all workspace users and rebuild the email -> user ID index.
+        
+        Bots and users without an email are skipped.
+        
+        Raises:
+            Exception: If a page request fails (the previous index is kept)
+        """
+        index: Dict[str, str] = {}
+        endpoint = f"/users?page_size={USER_PAGE_SIZE}"
+        while True:
+            response = await self._make_request("GET", endpoint)
+            for user in response.get("results", []):
+                if user.get("type") != "person":
                     continue
-                
-                if user_email == email_lower:
-                    user_id = user.get("id")
-                    if user_id:
-                        # Cache the result
-                        self._user_id_cache[email_lower] = user_id
-                        logger.debug(f"Found Notion user ID for {email}: {user_id}")
-                        return user_id
+                user_email = (user.get("person") or {}).get("email")
+                user_id = user.get("id")
+                if user_email and user_id:
+                    index[user_email.lower()] = user_id
             
-            logger.warning(f"Notion user not found for email: {email}")
-            return None
-        except Exception as e:
-            logger.warning(f"Could not get Notion user ID for {email}: {str(e)}")
-            return None
+            next_cursor = response.get("next_cursor")
+            if not response.get("has_more") or not next_cursor:
+                break
+            endpoint = f"/users?page_size={USER_PAGE_SIZE}&start_cursor={next_cursor}"
+        
+        self._user_id_cache = index
+        self._user_index_loaded_at = time.monotonic()
+        logger.info(f"Loaded Notion user index ({len(index)} users)")
     
-    def _build_people_property(self, email: str) -> Dict[str, Any]:
+    async def _build_people_property(self, email: str) -> Dict[str, Any]:
         """
         Build a Notion people property from an email address.
         
@@ -104,7 +193,7 @@ class NotionService:
         Returns:
             Notion people property dictionary
         """
-        user_id = self._get_user_id_by_email(email)
+        user_id = await self._get_user_id_by_email(email)
         if user_id:
             return {
                 "people": [
@@ -120,13 +209,13 @@ class NotionService:
                 "people": []
             }
     
-    def __del__(self):
-        """Cleanup httpx client on destruction."""
-        if hasattr(self, '_http_client'):
-            self._http_client.close()
+    async def aclose(self) -> None:
+        """Close the httpx client if this service owns it (must be awaited from the event loop)."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
             logger.debug("NotionService httpx client closed")
     
-    def _make_request(
+    async def _make_request(
         self,
         method: str,
         endpoint: str,
@@ -148,18 +237,21 @@ class NotionService:
         Raises:
             Exception: If request fails
         """
-        url = f"{NOTION_API_BASE}/{endpoint.lstrip('/')}"
-        
         try:
-            # Use persistent client with connection pooling
-            response = self._http_client.request(
+            # Use persistent client with connection pooling (base_url and headers set on the client)
+            response = await self._http_client.request(
                 method=method,
-                url=url,
-                headers=self.headers,
-                json=data
+                url=endpoint,
+                content=orjson.dumps(data) if data is not None else None
             )
+            if not self._http_version_logged:
+                self._http_version_logged = True
+                logger.debug("Notion API negotiated %s", response.http_version)
             response.raise_for_status()
-            return response.json()
+            # No body to parse (e.g. 204 No Content)
+            if not response.content:
+                return {}
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             logger.error(f"Notion API request failed: {e.response.status_code} - {e.response.text}")
             raise
@@ -167,16 +259,23 @@ class NotionService:
             logger.error(f"Notion API request error: {str(e)}")
             raise
     
-    def ticket_exists(self, teams_message_id: str) -> bool:
+    async def ticket_exists(self, teams_message_id: str) -> bool:
         """
         Check if a ticket with the given Teams Message ID already exists.
         
+        IDs recently seen with a ticket are answered from memory; otherwise the
+        Notion database is queried.
+        
         Args:
             teams_message_id: Teams message ID to check
             
         Returns:
             True if ticket exists, False otherwise
         """
+        if teams_message_id in self._seen_message_ids:
+            self._seen_message_ids.move_to_end(teams_message_id)
+            return True
+        
         try:
             # Query the database for existing ticket with this message ID
             query_data = {
@@ -188,15 +287,37 @@ class NotionService:
                 }
             }
             
-            response = self._make_request("POST", f"/databases/{self.database_id}/query", data=query_data)
-            results = response.get("results", [])
-            return len(results) > 0
+            response = await self._make_request("POST", f"/databases/{self.database_id}/query", data=query_data)
+            if response.get("results"):
+                self._remember_ticket(teams_message_id)
+                return True
+            return False
         except Exception as e:
             logger.warning(f"Error checking for existing ticket: {str(e)}")
             # If query fails, assume ticket doesn't exist to avoid blocking creation
             return False
     
-    def create_ticket(
+    def _remember_ticket(self, teams_message_id: str) -> None:
+        """Record that a ticket exists for a Teams message, evicting the oldest entry when full."""
+        self._seen_message_ids[teams_message_id] = True
+        self._seen_message_ids.move_to_end(teams_message_id)
+        if len(self._seen_message_ids) > SEEN_MESSAGE_IDS_MAX:
+            self._seen_message_ids.popitem(last=False)
+    
+    async def bulk_ticket_exists(self, teams_message_ids: List[str]) -> Dict[str, bool]:
+        """
+        Check several Teams Message IDs for existing tickets concurrently.
+        
+        Args:
+            teams_message_ids: Teams message IDs to check
+            
+        Returns:
+            Mapping of Teams message ID to whether a ticket exists
+        """
+        results = await asyncio.gather(*(self.ticket_exists(message_id) for message_id in teams_message_ids))
+        return dict(zip(teams_message_ids, results))
+    
+    async def create_ticket(
         self,
         task_title: str,
         description: str,
@@ -234,8 +355,14 @@ class NotionService:
         Raises:
             Exception: If ticket creation fails
         """
-        # Check for duplicates
-        if self.ticket_exists(teams_message_id):
+        # Check for duplicates while resolving requester and approver Notion users,
+        # so the three lookups cost one round-trip of wall-clock time
+        exists, requester_property, approver_property = await asyncio.gather(
+            self.ticket_exists(teams_message_id),
+            self._build_people_property(requester_email),
+            self._build_people_property(approved_by_email)
+        )
+        if exists:
             logger.info(f"Ticket with Teams Message ID {teams_message_id} already exists, skipping creation")
             raise ValueError(f"Ticket with Teams Message ID {teams_message_id} already exists")
         
@@ -273,7 +400,7 @@ class NotionService:
                     "name": status
                 }
             },
-            "Requester": self._build_people_property(requester_email),
+            "Requester": requester_property,
             "Teams Message ID": {
                 "rich_text": [
                     {
@@ -295,7 +422,7 @@ class NotionService:
             "Attachments": {
                 "url": attachments[0] if attachments else None
             },
-            "Approved By": self._build_people_property(approved_by_email),
+            "Approved By": approver_property,
             "Approved At": {
                 "date": {
                     "start": approved_at_iso
@@ -325,4 +452,10 @@ class NotionService:
         }
         
         logger.info(f"Creating Notion ticket for Teams message {teams_message_id}")
-        return self._make_request("POST", "/pages", data=page_data)
+        page = await self._make_request("POST", "/pages", data=page_data)
+        self._remember_ticket(teams_message_id)
+        return page
+
+
+# Shared instance - every route and background task uses this one connection pool
+notion_service = NotionService()
@@ -0,0 +1,37 @@
+"""Shared test setup: minimal settings so config.Settings() can load without a .env file."""
+import os
+import msal
+
+for _name, _value in {
+    "MICROSOFT_CLIENT_ID": "test-client-id",
+    "MICROSOFT_CLIENT_SECRET": "test-client-secret",
+    "MICROSOFT_TENANT_ID": "test-tenant-id",
+    "NOTION_API_TOKEN": "test-notion-token",
+    "NOTION_DATABASE_ID": "test-database-id",
+    "ALLOWED_USERS": "user@example.com",
+    "WEBHOOK_NOTIFICATION_URL": "https://example.com/webhook",
+    "WEBHOOK_CLIENT_STATE": "test-client-state",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+
+class OfflineConfidentialClientApplication:
+    """
+    Stand-in for MSAL's client: the real one runs authority discovery over the network
+    when services.graph_service builds its module-level instance.
+    
+    Every token request returns a new token so tests can tell refreshes apart.
+    """
+    
+    tokens_issued = 0
+    
+    def __init__(self, *args, **kwargs):
+        pass
+    
+    def acquire_token_for_client(self, scopes):
+        OfflineConfidentialClientApplication.tokens_issued += 1
+        return {"access_token": f"test-token-{self.tokens_issued}", "expires_in": 3600}
+
+
+# Must run before services.graph_service imports the name
+msal.ConfidentialClientApplication = OfflineConfidentialClientApplication
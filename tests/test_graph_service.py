@@ -0,0 +1,168 @@
+"""Tests for GraphService retries and $batch handling against a mocked Graph transport."""
+import asyncio
+import httpx
+import orjson
+import pytest
+from services import graph_service as graph_module
+from services.graph_service import (
+    GRAPH_API_BASE,
+    GRAPH_BATCH_LIMIT,
+    GRAPH_MAX_RETRIES,
+    GraphServerError,
+    GraphService,
+    GraphUnauthorized,
+)
+
+
+def make_service(handler):
+    """GraphService whose HTTP calls are answered by handler(request) -> httpx.Response."""
+    client = httpx.AsyncClient(base_url=GRAPH_API_BASE, transport=httpx.MockTransport(handler))
+    return GraphService(http_client=client)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(graph_module, "GRAPH_RETRY_BASE_DELAY", 0.0)
+
+
+def test_401_refreshes_token_once_and_retries():
+    seen_tokens = []
+    
+    def handler(request):
+        seen_tokens.append(request.headers["Authorization"])
+        if len(seen_tokens) == 1:
+            return httpx.Response(401, json={"error": {"code": "InvalidAuthenticationToken", "message": "expired"}})
+        return httpx.Response(200, json={"id": "me"})
+    
+    service = make_service(handler)
+    assert asyncio.run(service._make_request("GET", "/me")) == {"id": "me"}
+    assert len(seen_tokens) == 2
+    assert seen_tokens[0] != seen_tokens[1]
+
+
+def test_repeated_401_is_raised_after_one_refresh():
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(401, json={"error": {"code": "InvalidAuthenticationToken", "message": "revoked"}})
+    
+    service = make_service(handler)
+    with pytest.raises(GraphUnauthorized):
+        asyncio.run(service._make_request("GET", "/me"))
+    assert len(calls) == 2
+
+
+def test_429_is_retried_after_retry_after():
+    statuses = iter([429, 429, 200])
+    
+    def handler(request):
+        status = next(statuses)
+        if status == 429:
+            return httpx.Response(429, headers={"Retry-After": "0"}, json={"error": {"message": "slow down"}})
+        return httpx.Response(200, json={"value": []})
+    
+    service = make_service(handler)
+    # POST is not idempotent, but throttled requests were never processed so they are retried too
+    assert asyncio.run(service._make_request("POST", "/subscriptions", data={})) == {"value": []}
+
+
+def test_transient_5xx_retried_for_get_until_limit():
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, json={"error": {"message": "unavailable"}})
+    
+    service = make_service(handler)
+    with pytest.raises(GraphServerError):
+        asyncio.run(service._make_request("GET", "/subscriptions"))
+    assert len(calls) == GRAPH_MAX_RETRIES + 1
+
+
+def test_transient_5xx_not_retried_for_post():
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, json={"error": {"message": "unavailable"}})
+    
+    service = make_service(handler)
+    with pytest.raises(GraphServerError):
+        asyncio.run(service._make_request("POST", "/subscriptions", data={}))
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("retry_after, expected", [
+    ("2", 2.0),
+    ("3600", graph_module.GRAPH_RETRY_MAX_DELAY),
+    ("not-a-number", 0.0),
+    (None, 0.0),
+])
+def test_retry_delay_prefers_retry_after(retry_after, expected):
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    response = httpx.Response(429, headers=headers)
+    assert GraphService._retry_delay(response, attempt=2) == expected
+
+
+def batch_handler(sub_requests_seen, respond=None, delay=0.0):
+    """Mock $batch endpoint: records each call's sub-requests and answers them in reverse order."""
+    async def handler(request):
+        assert request.url.path.endswith("/$batch")
+        sub_requests = orjson.loads(request.content)["requests"]
+        sub_requests_seen.append(sub_requests)
+        if delay:
+            await asyncio.sleep(delay)
+        responses = [
+            (respond or (lambda sub: {"id": sub["id"], "status": 200, "body": {"url": sub["url"]}}))(sub)
+            for sub in reversed(sub_requests)
+        ]
+        return httpx.Response(200, json={"responses": [r for r in responses if r is not None]})
+    return handler
+
+
+def test_batch_splits_into_limit_sized_calls_and_demultiplexes_by_id():
+    calls = []
+    service = make_service(batch_handler(calls))
+    paths = {f"r{i}": f"/users/u{i}" for i in range(2 * GRAPH_BATCH_LIMIT + 5)}
+    
+    results = asyncio.run(service.batch_get(paths))
+    
+    assert sorted(len(call) for call in calls) == [5, GRAPH_BATCH_LIMIT, GRAPH_BATCH_LIMIT]
+    assert results == {request_id: {"url": path} for request_id, path in paths.items()}
+
+
+def test_batch_reports_failed_and_missing_sub_requests_per_id():
+    def respond(sub):
+        if sub["id"] == "missing":
+            return None
+        if sub["id"] == "gone":
+            return {"id": "gone", "status": 404, "body": {"error": {"message": "Not found"}}}
+        return {"id": sub["id"], "status": 200, "body": {"ok": True}}
+    
+    service = make_service(batch_handler([], respond=respond))
+    results = asyncio.run(service.batch_get({"ok": "/users/a", "gone": "/users/b", "missing": "/users/c"}))
+    
+    assert results["ok"] == {"ok": True}
+    assert "404" in str(results["gone"])
+    assert isinstance(results["missing"], Exception)
+
+
+def test_cached_batch_get_shares_in_flight_lookups():
+    calls = []
+    service = make_service(batch_handler(calls, delay=0.01))
+    
+    async def run():
+        first, second = await asyncio.gather(
+            service.batch_get({"a": "/users/u1", "b": "/teams/t/channels/c"}, cached=True),
+            service.batch_get({"x": "/users/u1"}, cached=True),
+        )
+        # Now cached: answered without another round-trip
+        third = await service.batch_get({"y": "/users/u1"}, cached=True)
+        return first, second, third
+    
+    first, second, third = asyncio.run(run())
+    
+    assert [sub["url"] for call in calls for sub in call] == ["/users/u1", "/teams/t/channels/c"]
+    assert first["a"] == second["x"] == third["y"] == {"url": "/users/u1"}
+    assert not service._inflight_lookups
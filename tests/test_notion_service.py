@@ -0,0 +1,75 @@
+"""Tests for the NotionService user index against a mocked Notion transport."""
+import asyncio
+import httpx
+from services.notion_service import NOTION_API_BASE, USER_INDEX_TTL, NotionService
+
+PAGES = {
+    None: {
+        "results": [
+            {"object": "user", "id": "u-alice", "type": "person", "person": {"email": "Alice@Example.com"}},
+            {"object": "user", "id": "u-bot", "type": "bot", "bot": {}},
+        ],
+        "has_more": True,
+        "next_cursor": "cursor-2",
+    },
+    "cursor-2": {
+        "results": [
+            {"object": "user", "id": "u-bob", "type": "person", "person": {"email": "bob@example.com"}},
+            {"object": "user", "id": "u-noemail", "type": "person", "person": {}},
+        ],
+        "has_more": False,
+        "next_cursor": None,
+    },
+}
+
+
+def make_service(requests_seen):
+    """NotionService whose /users calls are answered from PAGES."""
+    def handler(request):
+        assert request.url.path.endswith("/users")
+        requests_seen.append(request)
+        return httpx.Response(200, json=PAGES[request.url.params.get("start_cursor")])
+    
+    client = httpx.AsyncClient(base_url=NOTION_API_BASE, transport=httpx.MockTransport(handler))
+    return NotionService(http_client=client)
+
+
+def test_user_index_follows_pagination():
+    requests_seen = []
+    service = make_service(requests_seen)
+    
+    assert asyncio.run(service._get_user_id_by_email("bob@EXAMPLE.com")) == "u-bob"
+    
+    assert [r.url.params.get("start_cursor") for r in requests_seen] == [None, "cursor-2"]
+    # Person users with an email only, keyed by lowercased email
+    assert service._user_id_cache == {"alice@example.com": "u-alice", "bob@example.com": "u-bob"}
+
+
+def test_miss_does_not_reload_a_fresh_index():
+    requests_seen = []
+    service = make_service(requests_seen)
+    
+    async def run():
+        assert await service._get_user_id_by_email("alice@example.com") == "u-alice"
+        assert await service._get_user_id_by_email("external@partner.com") is None
+        assert await service._get_user_id_by_email("external@partner.com") is None
+    
+    asyncio.run(run())
+    assert len(requests_seen) == len(PAGES)
+
+
+def test_miss_reloads_a_stale_index():
+    requests_seen = []
+    service = make_service(requests_seen)
+    
+    async def run():
+        assert await service._get_user_id_by_email("external@partner.com") is None
+        # Age the index past its TTL
+        service._user_index_loaded_at -= USER_INDEX_TTL + 1
+        assert await service._get_user_id_by_email("external@partner.com") is None
+        # Hits never reload, even on a stale index
+        service._user_index_loaded_at -= USER_INDEX_TTL + 1
+        assert await service._get_user_id_by_email("alice@example.com") == "u-alice"
+    
+    asyncio.run(run())
+    assert len(requests_seen) == 2 * len(PAGES)
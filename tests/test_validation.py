@@ -0,0 +1,37 @@
+"""Tests for allow-list checks in utils.validation."""
+import pytest
+from config import settings
+from utils.validation import check_user, is_user_allowed
+
+
+@pytest.fixture
+def domain_allow_list(monkeypatch):
+    """Allow one exact address plus every address in example.org."""
+    # A new list object makes utils.validation rebuild its sets and invalidate cached decisions
+    monkeypatch.setattr(settings, "allowed_users", ["alice@example.com", "@example.org"])
+
+
+def test_domain_entry_allows_addresses_in_domain(domain_allow_list):
+    assert is_user_allowed("bob@example.org")
+    assert is_user_allowed(" Bob@Example.org ")
+    assert check_user("Bob@Example.org") == (True, "bob@example.org")
+
+
+@pytest.mark.parametrize("email", ["@example.org", " @example.org"])
+def test_domain_entry_rejects_empty_local_part(domain_allow_list, email):
+    assert not is_user_allowed(email)
+    assert check_user(email) == (False, "@example.org")
+
+
+def test_exact_entry_still_required_outside_allowed_domains(domain_allow_list):
+    assert is_user_allowed("alice@example.com")
+    assert not is_user_allowed("bob@example.com")
+
+
+def test_check_user_decisions_follow_allow_list_replacement(domain_allow_list, monkeypatch):
+    assert check_user("Carol@Example.com") == (False, "carol@example.com")
+    # Served from the decision cache until the allow-list object is replaced
+    assert check_user("Carol@Example.com") == (False, "carol@example.com")
+    monkeypatch.setattr(settings, "allowed_users", ["carol@example.com"])
+    assert check_user("Carol@Example.com") == (True, "carol@example.com")
+    assert is_user_allowed("Carol@Example.com")
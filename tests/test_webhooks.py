@@ -0,0 +1,190 @@
+"""Tests for the validation fast path and notification scheduling in routes.webhooks."""
+import asyncio
+from types import SimpleNamespace
+import pytest
+from starlette.testclient import TestClient
+from config import settings
+from main import app
+from models.webhook_models import GraphMessage
+from routes import webhooks
+
+
+@pytest.fixture
+def client():
+    # No context manager: lifespan (subscriptions, polling, workers) is not started
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/webhook", "/graph/validate"])
+@pytest.mark.parametrize("method", ["GET", "POST"])
+def test_validation_token_echoed_as_plain_text(client, path, method):
+    response = client.request(method, path, params={"validationToken": "abc123"})
+    assert response.status_code == 200
+    assert response.text == "abc123"
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert response.headers["content-length"] == "6"
+
+
+@pytest.mark.parametrize("query, token", [
+    ("validationToken=a%2Bb%3Dc", "a+b=c"),
+    ("validationToken=Validation%3A+Testing+Request-Id%3A+abc", "Validation: Testing Request-Id: abc"),
+    ("foo=1&validationToken=x+y", "x y"),
+])
+def test_validation_token_is_url_decoded(client, query, token):
+    response = client.get(f"/webhook?{query}")
+    assert response.status_code == 200
+    assert response.text == token
+
+
+@pytest.mark.parametrize("method", ["PUT", "DELETE", "PATCH"])
+def test_other_methods_fall_through_to_routing(client, method):
+    response = client.request(method, "/webhook", params={"validationToken": "abc123"})
+    assert response.status_code == 405
+
+
+def test_similar_parameter_name_is_not_a_token(client):
+    # Only an exact validationToken parameter takes the fast path
+    response = client.get("/graph/validate?xvalidationToken=abc123")
+    assert response.text != "abc123"
+
+
+@pytest.fixture
+def reaction_queue(monkeypatch):
+    """Fresh single-slot reaction queue and debounce cache (no workers draining them)."""
+    queue = asyncio.Queue(maxsize=1)
+    monkeypatch.setattr(webhooks, "_reaction_queue", queue)
+    webhooks._recently_scheduled.clear()
+    yield queue
+    webhooks._recently_scheduled.clear()
+
+
+def post_notification(client, *message_ids):
+    """POST a Graph change notification with one 'created' change per message ID."""
+    body = {"value": [
+        {
+            "changeType": "created",
+            "clientState": settings.webhook_client_state,
+            "resource": f"teams('team-1')/channels('channel-1')/messages('{message_id}')",
+            "subscriptionId": "subscription-1",
+        }
+        for message_id in message_ids
+    ]}
+    response = client.post("/webhook/notification", json=body)
+    assert response.status_code == 202
+    return response
+
+
+def test_repeated_notifications_for_a_message_are_queued_once(client, reaction_queue):
+    post_notification(client, "m1", "m1")
+    post_notification(client, "m1")
+    
+    assert reaction_queue.qsize() == 1
+    assert ("team-1", "channel-1", "m1") in webhooks._recently_scheduled
+
+
+def test_dropped_notification_is_not_debounced(client, reaction_queue):
+    # The single slot is taken by m1, so m2 is dropped
+    post_notification(client, "m1", "m2")
+    assert reaction_queue.qsize() == 1
+    assert ("team-1", "channel-1", "m2") not in webhooks._recently_scheduled
+    
+    # Once there is room again, the next notification for m2 is queued
+    reaction_queue.get_nowait()
+    post_notification(client, "m2")
+    assert reaction_queue.get_nowait().resource.endswith("messages('m2')")
+
+
+def make_change(message_id):
+    """A 'created' change notification for a message in team-1/channel-1."""
+    return webhooks.ChangeNotification(
+        changeType="created",
+        resource=f"teams('team-1')/channels('channel-1')/messages('{message_id}')",
+        subscriptionId="subscription-1",
+    )
+
+
+def test_worker_pool_drains_queue_and_survives_failures(monkeypatch):
+    fetched = []
+    
+    async def failing_get_message(team_id, channel_id, message_id):
+        fetched.append(message_id)
+        raise RuntimeError("Graph unavailable")
+    
+    monkeypatch.setattr(webhooks, "graph_service", SimpleNamespace(get_message=failing_get_message))
+    
+    async def run():
+        monkeypatch.setattr(webhooks, "_reaction_queue", asyncio.Queue(maxsize=10))
+        webhooks.start_reaction_workers(count=2)
+        try:
+            for i in range(5):
+                assert webhooks.schedule_reaction_processing(make_change(f"m{i}"))
+            # Every item is processed and marked done even though each one failed
+            await asyncio.wait_for(webhooks._reaction_queue.join(), timeout=1)
+        finally:
+            await webhooks.stop_reaction_workers()
+    
+    asyncio.run(run())
+    assert sorted(fetched) == [f"m{i}" for i in range(5)]
+
+
+def test_schedule_reports_full_queue(monkeypatch):
+    monkeypatch.setattr(webhooks, "_reaction_queue", asyncio.Queue(maxsize=1))
+    notification = make_change("m1")
+    assert webhooks.schedule_reaction_processing(notification)
+    assert not webhooks.schedule_reaction_processing(notification)
+
+
+def test_concurrent_ticket_creation_for_a_message_is_skipped(monkeypatch):
+    calls = []
+    
+    async def slow_create(team_id, channel_id, message_id, *args):
+        calls.append(message_id)
+        await asyncio.sleep(0.01)
+        return True
+    
+    monkeypatch.setattr(webhooks, "_create_ticket_for_reaction", slow_create)
+    
+    async def run():
+        results = await asyncio.gather(
+            webhooks.create_ticket_for_reaction("t", "c", "m1", None, None),
+            webhooks.create_ticket_for_reaction("t", "c", "m1", None, None, source=" (from polling)"),
+            webhooks.create_ticket_for_reaction("t", "c", "m2", None, None),
+        )
+        # Released once done, so a later attempt runs again
+        results.append(await webhooks.create_ticket_for_reaction("t", "c", "m1", None, None))
+        return results
+    
+    assert asyncio.run(run()) == [True, False, True, True]
+    assert calls == ["m1", "m2", "m1"]
+    assert not webhooks._tickets_in_flight
+
+
+def test_polling_keeps_message_until_ticket_created(monkeypatch):
+    ref = ("t", "c", "m1")
+    message = GraphMessage(id="m1", reactions=[{"reactionType": webhooks.TICKET_EMOJI, "user": {}}])
+    outcomes = iter([False, True])
+    polled = []
+    
+    async def fake_get_messages_bulk(refs):
+        return {r: message for r in refs}
+    
+    async def fake_create(team_id, channel_id, message_id, *args, **kwargs):
+        # Record whether the message was still queued when the ticket was attempted
+        polled.append(ref in webhooks._recent_messages)
+        return next(outcomes)
+    
+    monkeypatch.setattr(webhooks, "REACTION_POLL_INTERVAL", 0)
+    monkeypatch.setattr(webhooks, "graph_service", SimpleNamespace(get_messages_bulk=fake_get_messages_bulk))
+    monkeypatch.setattr(webhooks, "create_ticket_for_reaction", fake_create)
+    monkeypatch.setattr(webhooks, "_recent_messages", {ref: webhooks.time.time()})
+    
+    async def run():
+        task = asyncio.create_task(webhooks.poll_messages_for_reactions())
+        while ref in webhooks._recent_messages:
+            await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+    
+    asyncio.run(asyncio.wait_for(run(), timeout=1))
+    # Skipped (False) on the first poll, still queued for the second, removed once created
+    assert polled == [True, True]
@@ -1,4 +1,5 @@
 """Authentication helpers."""
+import hmac
 import logging
 from typing import Optional
 
@@ -16,4 +17,7 @@ def verify_webhook_client_state(client_state: Optional[str]) -> bool:
         True if client state matches, False otherwise
     """
     from config import settings
-    return client_state == settings.webhook_client_state
+    if client_state is None:
+        return False
+    # Constant-time comparison so the secret can't be probed via response timing
+    return hmac.compare_digest(client_state.encode(), settings.webhook_client_state.encode())
@@ -1,6 +1,6 @@
 """Microsoft Graph subscription normalization and validation utilities."""
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -8,6 +8,110 @@ logger = logging.getLogger(__name__)
 # Teams message subscriptions have a maximum expiration of 1 hour
 TEAMS_MAX_EXPIRATION = timedelta(hours=1)
 
+# The only changeType Teams message subscriptions support
+TEAMS_CHANGE_TYPE = "created"
+
+
+def format_graph_datetime(dt: datetime) -> str:
+    """
+    Format a datetime as the UTC ISO 8601 string Graph expects (Z suffix, not +00:00).
+
+    Naive datetimes are treated as UTC.
+
+    Args:
+        dt: Datetime to format
+
+    Returns:
+        String like "2024-01-01T12:00:00.000000Z"
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    elif dt.utcoffset():
+        dt = dt.astimezone(timezone.utc)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _normalize_resource_rules(
+    resource: str, change_types: Tuple[str, ...]
+) -> Tuple[str, str, bool]:
+    """
+    Apply the time-independent subscription rules for a resource.
+
+    Args:
+        resource: Resource path to subscribe to
+        change_types: Requested change types
+
+    Returns:
+        Tuple of (normalized resource, comma-joined changeType, is_teams_messages)
+    """
+    # --- Resource MUST start with '/'
+    if not resource.startswith("/"):
+        logger.warning("Normalizing resource to start with '/'")
+        resource = "/" + resource
+
+    is_teams_messages = resource.startswith("/teams/") and "/messages" in resource
+
+    # changeType - Teams messages ONLY support "created"
+    if is_teams_messages and change_types != (TEAMS_CHANGE_TYPE,):
+        logger.warning(
+            "Teams messages only support changeType=['created']. "
+            f"Filtering from: {list(change_types)}"
+        )
+        change_types = (TEAMS_CHANGE_TYPE,)
+
+    return resource, ",".join(change_types), is_teams_messages
+
+
+def normalize_teams_subscription(
+    *,
+    resource: str,
+    notification_url: str,
+    lifecycle_notification_url: Optional[str],
+    expiration_datetime: Optional[datetime],
+    client_state: str,
+) -> Dict[str, str]:
+    """
+    Build the subscription payload for a Teams channel messages resource.
+
+    Fast path for the supported configuration: changeType is always "created",
+    expiration is capped at 1 hour and a lifecycle URL is required.
+
+    Args:
+        resource: Normalized Teams messages resource (leading '/')
+        notification_url: URL to receive notifications
+        lifecycle_notification_url: URL for lifecycle notifications
+        expiration_datetime: Subscription expiration datetime (default: 1 hour)
+        client_state: Client state for webhook validation
+
+    Returns:
+        Subscription payload dictionary
+
+    Raises:
+        ValueError: If lifecycle_notification_url is missing
+    """
+    # lifecycleNotificationUrl REQUIRED for Teams messages
+    if not lifecycle_notification_url:
+        raise ValueError(
+            "lifecycleNotificationUrl is REQUIRED for Teams message subscriptions"
+        )
+
+    now = datetime.now(timezone.utc)
+    max_expiration = now + TEAMS_MAX_EXPIRATION
+    if expiration_datetime is None:
+        expiration_datetime = max_expiration
+    elif expiration_datetime - now > TEAMS_MAX_EXPIRATION:
+        logger.warning("Capping Teams subscription expiration to 1 hour")
+        expiration_datetime = max_expiration
+
+    return {
+        "resource": resource,
+        "changeType": TEAMS_CHANGE_TYPE,
+        "notificationUrl": notification_url,
+        "expirationDateTime": format_graph_datetime(expiration_datetime),
+        "clientState": client_state,
+        "lifecycleNotificationUrl": lifecycle_notification_url,
+    }
+
 
 def normalize_graph_subscription(
     *,
@@ -38,51 +142,32 @@ def normalize_graph_subscription(
     Raises:
         ValueError: If required fields are missing for Teams subscriptions
     """
-    # --- Resource MUST start with '/'
-    if not resource.startswith("/"):
-        logger.warning("Normalizing resource to start with '/'")
-        resource = "/" + resource
-
-    now = datetime.now(timezone.utc)
-
-    # --- Expiration (default + clamp)
-    if expiration_datetime is None:
-        expiration_datetime = now + TEAMS_MAX_EXPIRATION
-
-    # --- Teams messages rules
-    is_teams_messages = resource.startswith("/teams/") and "/messages" in resource
+    # --- Resource and changeType rules
+    resource, change_type, is_teams_messages = _normalize_resource_rules(
+        resource, tuple(change_types)
+    )
 
+    # --- Teams messages (the common case) take the specialized path
     if is_teams_messages:
-        # changeType - Teams messages ONLY support "created"
-        if change_types != ["created"]:
-            logger.warning(
-                "Teams messages only support changeType=['created']. "
-                f"Filtering from: {change_types}"
-            )
-            change_types = ["created"]
-
-        # expiration ≤ 1 hour
-        if expiration_datetime - now > TEAMS_MAX_EXPIRATION:
-            logger.warning("Capping Teams subscription expiration to 1 hour")
-            expiration_datetime = now + TEAMS_MAX_EXPIRATION
-
-        # lifecycleNotificationUrl REQUIRED for Teams messages
-        if not lifecycle_notification_url:
-            raise ValueError(
-                "lifecycleNotificationUrl is REQUIRED for Teams message subscriptions"
-            )
+        return normalize_teams_subscription(
+            resource=resource,
+            notification_url=notification_url,
+            lifecycle_notification_url=lifecycle_notification_url,
+            expiration_datetime=expiration_datetime,
+            client_state=client_state,
+        )
+
+    # --- Expiration default
+    if expiration_datetime is None:
+        expiration_datetime = datetime.now(timezone.utc) + TEAMS_MAX_EXPIRATION
 
     # --- Format datetime to ISO 8601 with Z (not +00:00)
-    expiration_str = expiration_datetime.isoformat()
-    if expiration_str.endswith("+00:00"):
-        expiration_str = expiration_str.replace("+00:00", "Z")
-    elif not expiration_str.endswith("Z"):
-        expiration_str += "Z"
+    expiration_str = format_graph_datetime(expiration_datetime)
 
     # Build payload
     payload = {
         "resource": resource,
-        "changeType": ",".join(change_types),
+        "changeType": change_type,
         "notificationUrl": notification_url,
         "expirationDateTime": expiration_str,
         "clientState": client_state,
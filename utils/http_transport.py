@@ -0,0 +1,52 @@
+"""Shared httpx transport configuration for the Graph and Notion clients."""
+import socket
+from typing import List, Tuple
+import httpx
+
+# Seconds a connection may sit idle before the kernel starts sending keep-alive probes
+TCP_KEEPALIVE_IDLE = 60
+
+
+def _socket_options() -> List[Tuple[int, int, int]]:
+    """
+    Build the socket options applied to every outbound connection.
+    
+    TCP_NODELAY sends small requests without Nagle delay; SO_KEEPALIVE probes keep
+    idle pooled connections alive through NAT/firewall idle timeouts.
+    
+    Returns:
+        List of (level, option, value) tuples for httpx
+    """
+    options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    # TCP_KEEPIDLE is Linux-specific; elsewhere the OS default idle time applies
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE))
+    return options
+
+
+SOCKET_OPTIONS = _socket_options()
+
+
+def build_async_transport(limits: httpx.Limits, http2: bool = True) -> httpx.AsyncHTTPTransport:
+    """
+    Build an async transport with tuned socket options and one connect retry.
+    
+    A client given a transport ignores its own limits/http2 arguments, so they are
+    configured here instead.
+    
+    Args:
+        limits: Connection pool limits
+        http2: Whether to negotiate HTTP/2
+        
+    Returns:
+        Configured httpx.AsyncHTTPTransport
+    """
+    return httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=limits,
+        retries=1,
+        socket_options=SOCKET_OPTIONS
+    )
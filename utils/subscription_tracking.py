@@ -0,0 +1,49 @@
+"""Subscription creation tracking for webhook validation latency analysis."""
+import threading
+import time
+from typing import Optional, Tuple
+from cachetools import TTLCache
+
+# Bounds for subscription creation tracking (validations that never arrive expire)
+SUBSCRIPTION_TRACKING_MAX_ENTRIES = 10_000
+SUBSCRIPTION_TRACKING_TTL = 600
+
+# Track subscription creation times for latency analysis
+# Key: request_id from validation token, Value: (monotonic subscription_creation_time, resource)
+_subscription_creation_times: TTLCache = TTLCache(
+    maxsize=SUBSCRIPTION_TRACKING_MAX_ENTRIES,
+    ttl=SUBSCRIPTION_TRACKING_TTL
+)
+_subscription_creation_lock = threading.Lock()
+
+
+def track_subscription_creation(request_id: str, resource: str, created_at: Optional[float] = None) -> None:
+    """
+    Record when a subscription was created so validation latency can be measured.
+    
+    Args:
+        request_id: Graph request-id of the subscription creation call
+        resource: Resource the subscription was created for
+        created_at: time.monotonic() timestamp of the creation request (default: now)
+    """
+    with _subscription_creation_lock:
+        _subscription_creation_times[request_id] = (created_at or time.monotonic(), resource)
+
+
+def pop_subscription_creation(request_id: str) -> Optional[Tuple[float, str]]:
+    """
+    Remove and return the tracked creation for a validation request-id.
+    
+    Args:
+        request_id: Request-id parsed from the validation token
+    
+    Returns:
+        Tuple of (creation_time, resource), or None if nothing was tracked
+    """
+    with _subscription_creation_lock:
+        return _subscription_creation_times.pop(request_id, None)
+
+
+def has_tracked_subscriptions() -> bool:
+    """Check whether any subscription creations are awaiting their validation request."""
+    return bool(_subscription_creation_times)
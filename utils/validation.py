@@ -1,7 +1,40 @@
 """User authorization and validation utilities."""
-from typing import List, Optional
+import sys
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Tuple
+from cachetools import LRUCache
 from config import settings
-import re
+
+# Distinct emails remembered by the normalization cache (active users are a small set)
+EMAIL_CACHE_SIZE = 4096
+# Distinct raw emails remembered by the authorization cache; sized so repeated rejected
+# addresses (probes, stale clients) are answered from the cache as well
+AUTHORIZATION_CACHE_SIZE = 8192
+
+# Allow-list split into exact addresses and whole domains (entries written as "@domain"),
+# both as frozensets of normalize_email() forms for O(1) membership checks; built on first
+# use and rebuilt if settings.allowed_users is replaced (e.g. a settings reload)
+_allowed_users_source: Optional[List[str]] = None
+_allowed_users_set: FrozenSet[str] = frozenset()
+_allowed_domains_set: FrozenSet[str] = frozenset()
+# Bumped whenever the sets are rebuilt; cached decisions from an older version are stale
+_allowed_users_version = 0
+
+# Authorization decisions: raw email -> (allow-list version, allowed, canonical email)
+_decision_cache: LRUCache = LRUCache(maxsize=AUTHORIZATION_CACHE_SIZE)
+
+
+def _allowed_users() -> FrozenSet[str]:
+    """Return the allowed addresses, rebuilding both sets if settings.allowed_users was replaced."""
+    global _allowed_users_source, _allowed_users_set, _allowed_domains_set, _allowed_users_version
+    if settings.allowed_users is not _allowed_users_source:
+        _allowed_users_source = settings.allowed_users
+        entries = [sys.intern(normalize_email(entry)) for entry in _allowed_users_source]
+        _allowed_users_set = frozenset(entry for entry in entries if not entry.startswith("@"))
+        _allowed_domains_set = frozenset(entry[1:] for entry in entries if entry.startswith("@") and len(entry) > 1)
+        # Decisions made against the old list are invalidated (evicted lazily on next access)
+        _allowed_users_version += 1
+    return _allowed_users_set
 
 
 def normalize_email(email: Optional[str]) -> str:
@@ -16,38 +49,69 @@ def normalize_email(email: Optional[str]) -> str:
     """
     if not email:
         return email or ""
-    
-    # Convert to string and strip whitespace
-    normalized = str(email).strip()
-    
-    # Convert @CC3solutions.com to @cc3solutions.com (case-insensitive)
-    # Match @CC3solutions.com or any case variation
-    normalized = re.sub(
-        r'@CC3solutions\.com$',
-        '@cc3solutions.com',
-        normalized,
-        flags=re.IGNORECASE
-    )
-    
-    # Apply general normalization (lowercase)
-    normalized = normalized.lower()
-    
-    return normalized
+    # Already canonical (the common case): skip the string work and the cache lookup
+    if type(email) is str and email.islower() and not email[0].isspace() and not email[-1].isspace():
+        return email
+    return _normalize_email_cached(email if isinstance(email, str) else str(email))
+
+
+@lru_cache(maxsize=EMAIL_CACHE_SIZE)
+def _normalize_email_cached(email: str) -> str:
+    """Memoized core of normalize_email (the same few addresses repeat on every reaction)."""
+    # Lowercasing also canonicalizes @CC3solutions.com (any case) to @cc3solutions.com;
+    # skip it when only whitespace needed stripping
+    stripped = email.strip()
+    return stripped if stripped.islower() else stripped.lower()
 
 
 def is_user_allowed(email: str) -> bool:
     """
     Check if a user email is in the allowed users list.
     
+    An entry of the form "@example.com" allows every address in that domain.
+    
     Args:
         email: User email address to check
         
     Returns:
         True if user is allowed, False otherwise
     """
+    return check_user(email)[0]
+
+
+def check_user(email: Optional[str]) -> Tuple[bool, str]:
+    """
+    Canonicalize an email and check it against the allow-list in one call.
+    
+    Use instead of is_user_allowed(normalize_email(email)) when the caller also
+    needs the canonical address.
+    
+    Args:
+        email: User email address to check
+        
+    Returns:
+        Tuple of (allowed, canonical email)
+    """
     if not email:
-        return False
-    return email.lower().strip() in settings.allowed_users
+        return False, ""
+    # Refresh the allow-list first so a replaced list bumps the version
+    _allowed_users()
+    cached: Optional[Tuple[int, bool, str]] = _decision_cache.get(email)
+    if cached is not None and cached[0] == _allowed_users_version:
+        return cached[1], cached[2]
+    
+    canonical = normalize_email(email)
+    allowed = bool(canonical) and _is_canonical_allowed(canonical)
+    _decision_cache[email] = (_allowed_users_version, allowed, canonical)
+    return allowed, canonical
+
+
+def _is_canonical_allowed(canonical: str) -> bool:
+    """Uncached allow-list decision for an already-normalized email (not re-normalized)."""
+    if canonical in _allowed_users_set:
+        return True
+    local, at, domain = canonical.rpartition("@")
+    return bool(local) and bool(at) and domain in _allowed_domains_set
 
 
 def get_allowed_users() -> List[str]: